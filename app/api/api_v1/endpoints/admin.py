@@ -2,14 +2,14 @@ import json
 from typing import Any, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, BackgroundTasks, HTTPException, Query, Security
+from fastapi import APIRouter, BackgroundTasks, HTTPException, Query, Response, Security
 from fastapi import status as http_status
 from fastapi.requests import Request
 from pydantic import BaseModel, EmailStr
 
 from app.core.dependencies import AdminUserDep, SessionDep
 from app.core.security import get_password_hash, utc_now
-from app.core.utils import Page, paginate
+from app.core.utils import Page, json_response, paginate
 from app.main import api_key_header
 from app.models.enums import MatchStatus
 from app.models.user import User
@@ -178,15 +178,15 @@ def admin_get_user_matches(
     session: SessionDep,
     admin_user: AdminUserDep,
     user_id: UUID,
-    status: str | None = Query(None, description="Filter by match status"),
+    status: MatchStatus | None = Query(None, description="Filter by match status"),
     page: int = Query(default=1, ge=1),
     per_page: int = Query(default=25, ge=1, le=100),
-) -> Page[MatchOut]:
+) -> Response:
     """Get matches for a given user (admin)."""
     matches = MatchService(session).get_user_matches(user_id, status)
     page = paginate(query=matches, page=page, per_page=per_page, request=request)
     page.items = [MatchOut.from_match(m) for m in page.items]
-    return page
+    return json_response(page)
 
 
 @router.get("/users", response_model=Page[UserOut])
@@ -309,14 +309,14 @@ def get_matches(
     ),
     page: int = Query(default=1, ge=1),
     per_page: int = Query(default=25, ge=1, le=100),
-) -> Page[MatchOut]:
+) -> Response:
     """
     Get all matches (admin only)
     """
     matches = AdminService(session).get_matches(status, min_compatibility)
     page = paginate(query=matches, page=page, per_page=per_page, request=request)
     page.items = [MatchOut.from_match(m) for m in page.items]
-    return page
+    return json_response(page)
 
 
 @router.get("/journeys", response_model=Page[JourneyOut])
@@ -29,6 +29,7 @@ from app.schemas.auth import (
 )
 from app.schemas.user import UserOut
 from app.services.auth_service import AuthService
+from app.services.notification_service import forget_receiver_token
 from app.services.user_service import UserService
 from firebase import init_firebase
 
@@ -107,6 +108,7 @@ def sef_firebase_token(
 ) -> UserOut:
     current_user.firebase_token = firebase_token
     session.commit()
+    forget_receiver_token(current_user.id)
     return current_user
 
 
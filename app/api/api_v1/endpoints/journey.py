@@ -1,12 +1,12 @@
 from typing import Any
 from uuid import UUID
 
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, HTTPException, Query, Response
 from fastapi import status as http_status
 from fastapi.requests import Request
 
 from app.core.dependencies import SessionDep, VerifiedUserDep
-from app.core.utils import Page, paginate
+from app.core.utils import Page, json_response, paginate
 from app.models.enums import JourneyStep
 from app.schemas.journey import JourneyOut
 from app.schemas.meeting import (
@@ -121,13 +121,59 @@ def get_messages(
     journey_id: UUID,
     page: int = Query(default=1, ge=1),
     per_page: int = Query(default=25, ge=1, le=100),
-) -> Page[MessageOut]:
+) -> Response:
     """
     Get all messages for a journey
     """
     message_service = MessageService(session)
     messages = message_service.get_messages(journey_id)
-    return paginate(query=messages, page=page, per_page=per_page, request=request)
+    page = paginate(query=messages, page=page, per_page=per_page, request=request)
+
+    # senders are fetched once for the whole page instead of once per message
+    senders = message_service.get_sender_profiles(msg.sender_id for msg in page.items)
+    page.items = [MessageOut.from_message(msg, senders.get(msg.sender_id)) for msg in page.items]
+    return json_response(page)
+
+
+@router.get(
+    "/{journey_id}/messages/{message_id}",
+    response_model=MessageOut,
+    openapi_extra={"security": [{"APIKeyHeader": [], "HTTPBearer": []}]},
+)
+def get_message(
+    session: SessionDep,
+    current_user: VerifiedUserDep,
+    journey_id: UUID,
+    message_id: UUID,
+) -> MessageOut:
+    """
+    Get a single msg from a Journey (e.g. when opening a new message notification)
+    """
+
+    journey_service = JourneyService(session)
+    journey = journey_service.get_journey_by_id(journey_id)
+    if not journey:
+        raise HTTPException(
+            status_code=http_status.HTTP_404_NOT_FOUND,
+            detail="Journey with not found",
+        )
+
+    if current_user.id not in [journey.match.user1_id, journey.match.user2_id]:
+        raise HTTPException(
+            status_code=http_status.HTTP_401_UNAUTHORIZED,
+            detail="User not related to this journey",
+        )
+
+    msg_service = MessageService(session)
+    msg = msg_service.get_journey_message(journey_id, message_id)
+    if not msg:
+        raise HTTPException(
+            status_code=http_status.HTTP_404_NOT_FOUND,
+            detail="Message with not found",
+        )
+
+    senders = msg_service.get_sender_profiles([msg.sender_id])
+    return MessageOut.from_message(msg, senders.get(msg.sender_id))
 
 
 @router.delete(
@@ -278,7 +324,7 @@ def create_meeting_feedback(
             status_code=http_status.HTTP_404_NOT_FOUND,
             detail=f"Journey with ID '{journey_id}' not found",
         )
-    if current_user.id not in [journey.match.user1, journey.match.user2]:
+    if current_user.id not in (journey.match.user1_id, journey.match.user2_id):
         raise HTTPException(
             status_code=http_status.HTTP_401_UNAUTHORIZED,
             detail=f"User doesn't belong to Journey with ID '{journey_id}'",
@@ -1,12 +1,13 @@
 from typing import Any
 from uuid import UUID
 
-from fastapi import APIRouter, BackgroundTasks, HTTPException, Query
+from fastapi import APIRouter, BackgroundTasks, HTTPException, Query, Response
 from fastapi import status as http_status
 from fastapi.requests import Request
 
 from app.core.dependencies import FlexUserDep, SessionDep
-from app.core.utils import Page, paginate
+from app.core.utils import Page, json_response, paginate
+from app.models.enums import MatchStatus
 from app.models.user import User
 from app.schemas.match import MatchCreateRequest, MatchOut
 from app.services.match_service import MatchService
@@ -25,10 +26,10 @@ def get_my_matches(
     request: Request,
     session: SessionDep,
     current_user: FlexUserDep,
-    status: str = Query(None, description="Filter by match status"),
+    status: MatchStatus | None = Query(None, description="Filter by match status"),
     page: int = Query(default=1, ge=1),
     per_page: int = Query(default=25, ge=1, le=100),
-) -> Page[MatchOut]:
+) -> Response:
     """
     Get all matches for the current authenticated user
     """
@@ -36,7 +37,7 @@ def get_my_matches(
     matches = match_service.get_user_matches(current_user.id, status)
     page = paginate(query=matches, page=page, per_page=per_page, request=request)
     page.items = [MatchOut.from_match(m) for m in page.items]
-    return page
+    return json_response(page)
 
 
 @router.get(
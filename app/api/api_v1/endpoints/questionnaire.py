@@ -134,17 +134,28 @@ def get_null_field(session: SessionDep, current_user: VerifiedUserDep) -> list[C
     """
     quest_service = QuestionnaireService(session)
     categories = quest_service.get_all_categories()
-    if not current_user.questionnaire:
+    quest = current_user.questionnaire
+    if not quest:
         return categories
-    for category in categories:
-        for sub_category in category.sub_categories:
-            sub_category.fields = [
-                f
-                for f in sub_category.fields
-                if not current_user.questionnaire.is_field_answered(f.name)
-            ]
 
-    return categories
+    # the categories are cached and shared: build filtered copies, never mutate them
+    return [
+        {
+            **category,
+            "sub_categories": [
+                {
+                    **sub_category,
+                    "fields": [
+                        field
+                        for field in sub_category["fields"]
+                        if not quest.is_field_answered(field["name"])
+                    ],
+                }
+                for sub_category in category["sub_categories"]
+            ],
+        }
+        for category in categories
+    ]
 
 
 @router.get(
@@ -160,15 +171,25 @@ def get_answered_field(
     """
     quest_service = QuestionnaireService(session)
     categories = quest_service.get_all_categories()
-    if not current_user.questionnaire:
+    quest = current_user.questionnaire
+    if not quest:
         return categories
-    for category in categories:
-        for sub_category in category.sub_categories:
-            fields = []
-            for field in sub_category.fields:
-                if current_user.questionnaire.is_field_answered(field.name):
-                    field.answer = getattr(current_user.questionnaire, field.name)
-                    fields.append(field)
-            sub_category.fields = fields
-
-    return categories
+
+    # the categories are cached and shared: build annotated copies, never mutate them
+    return [
+        {
+            **category,
+            "sub_categories": [
+                {
+                    **sub_category,
+                    "fields": [
+                        {**field, "answer": getattr(quest, field["name"])}
+                        for field in sub_category["fields"]
+                        if quest.is_field_answered(field["name"])
+                    ],
+                }
+                for sub_category in category["sub_categories"]
+            ],
+        }
+        for category in categories
+    ]
@@ -2,7 +2,15 @@ from pprint import pprint as print
 from typing import Annotated
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Request, Response, UploadFile
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    Depends,
+    HTTPException,
+    Request,
+    Response,
+    UploadFile,
+)
 from fastapi import status as http_status
 from pydantic import BaseModel
 from twilio.request_validator import RequestValidator
@@ -14,6 +22,7 @@ from app.core.dependencies import SessionDep, VerifiedUserDep
 from app.models.enums import TwilioEvent
 from app.services.journey_service import JourneyService, MessageService
 from app.services.match_service import MatchService
+from app.services.notification_service import new_msg_notif_task
 from app.services.twilio_service import TwilioService
 
 router = APIRouter()
@@ -94,7 +103,9 @@ async def get_twilio_chat_token(current_user: VerifiedUserDep) -> TwilioChatToke
 
 
 @router.post("/chat-webhook", openapi_extra={"security": []})
-def twilio_chat_webhook(session: SessionDep, body: ChatWebhookBodyDep):
+def twilio_chat_webhook(
+    session: SessionDep, body: ChatWebhookBodyDep, background_tasks: BackgroundTasks
+):
     print("Twilio Chat Webhook:")
     print(body)
 
@@ -103,11 +114,8 @@ def twilio_chat_webhook(session: SessionDep, body: ChatWebhookBodyDep):
         if body.get("EventType") == TwilioEvent.ON_MESSAGE_ADDED:
             msg = msg_service.create_message(body)
             if msg:
-                try:
-                    msg.send_notif_to_receiver(title="new msg added")
-                except Exception as e:
-                    print(f"error sending new msg notif: {type(e)}")
-                    print(f"{e}")
+                # the firebase send happens after the webhook has been answered
+                background_tasks.add_task(new_msg_notif_task, msg.id, "new msg added")
 
         if body.get("EventType") == TwilioEvent.ON_MESSAGE_UPDATED:
             msg_service.update_message(body)
@@ -1,15 +1,15 @@
 import uuid
 from datetime import datetime
-from typing import Annotated, Generator
+from typing import Annotated, ClassVar, Generator
 
+import orjson
 from fastapi import Depends
-from sqlalchemy import DateTime, create_engine
+from sqlalchemy import DateTime, create_engine, func, inspect
 from sqlalchemy.dialects.postgresql import UUID as pgUUID
 from sqlalchemy.orm import DeclarativeBase, Mapped, Session, mapped_column, sessionmaker
 
-from app.core.security import utc_now
-
 from .config import settings
+from .utils import uuid7
 
 engine = create_engine(
     str(settings.DATABASE_URI),
@@ -19,6 +19,13 @@ engine = create_engine(
     pool_pre_ping=True,
     echo=False,
     future=True,
+    # batch multi-row INSERT ... RETURNING and executemany UPDATE/DELETE statements
+    executemany_mode="values_plus_batch",
+    insertmanyvalues_page_size=1000,
+    executemany_batch_page_size=500,
+    # JSONB columns (e.g. languages_spoken) go through orjson instead of the stdlib json module
+    json_serializer=lambda obj: orjson.dumps(obj).decode(),
+    json_deserializer=orjson.loads,
 )
 
 # Create a configured session class
@@ -40,11 +47,27 @@ class Base(DeclarativeBase):
     """
 
     __abstract__ = True
+    # no __slots__ / MappedAsDataclass(slots=True): ORM instance state and lazy-loaded
+    # attributes live in the instance __dict__, which SQLAlchemy does not support slotting
 
-    id: Mapped[uuid.UUID] = mapped_column(
-        pgUUID(as_uuid=True), primary_key=True, default=uuid.uuid4
-    )
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=datetime.now)
+    id: Mapped[uuid.UUID] = mapped_column(pgUUID(as_uuid=True), primary_key=True, default=uuid7)
+    # timestamps are set by postgres (fetched back with RETURNING on insert)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=utc_now, onupdate=utc_now
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
     )
+
+    # fields shown by __repr__ (after id), compiled once per model class
+    __repr_fields__: ClassVar[tuple[str, ...]] = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        fields = ", ".join(f"{field}=%s" for field in cls.__repr_fields__)
+        cls._repr_fmt = f"<{cls.__name__} %s: {fields}>" if fields else f"<{cls.__name__} %s>"
+
+    def __repr__(self) -> str:
+        # read the instance state only: repr() of an expired / detached object never hits the db
+        state = inspect(self)
+        loaded = state.dict
+        pk = state.identity[0] if state.identity else loaded.get("id")
+        return self._repr_fmt % (pk, *(loaded.get(field, "?") for field in self.__repr_fields__))
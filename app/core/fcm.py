@@ -0,0 +1,66 @@
+import logging
+from contextvars import ContextVar
+from threading import Lock
+
+from firebase_admin import messaging
+
+logger = logging.getLogger(__name__)
+
+# firebase caps a send_each batch at 500 messages
+FCM_BATCH_SIZE = 500
+
+
+class FCMOutbox:
+    """
+    Firebase messages collected during a request.
+    Once drained, the outbox is closed and later messages (e.g. from background tasks
+    still running after the flush) are sent right away instead of being lost.
+    """
+
+    def __init__(self):
+        self.messages: list[messaging.Message] = []
+        self.closed = False
+        self._lock = Lock()
+
+    def add(self, message: messaging.Message) -> bool:
+        with self._lock:
+            if self.closed:
+                return False
+            self.messages.append(message)
+            return True
+
+    def drain(self) -> list[messaging.Message]:
+        with self._lock:
+            self.closed = True
+            messages, self.messages = self.messages, []
+            return messages
+
+
+# request-scoped outbox, set by FCMOutboxMiddleware (None outside of a request)
+_fcm_outbox: ContextVar[FCMOutbox | None] = ContextVar("fcm_outbox", default=None)
+
+
+def queue_fcm_message(message: messaging.Message) -> None:
+    """
+    Queue a message in the current request's outbox,
+    or send it right away when there is no open outbox (cron jobs, scripts...)
+    """
+    outbox = _fcm_outbox.get()
+    if outbox is None or not outbox.add(message):
+        messaging.send(message)
+
+
+def send_fcm_messages(messages: list[messaging.Message]) -> None:
+    """Send messages in batches with send_each, logging the failed ones"""
+    for start in range(0, len(messages), FCM_BATCH_SIZE):
+        batch = messages[start : start + FCM_BATCH_SIZE]
+        try:
+            response = messaging.send_each(batch)
+        except Exception as e:
+            logger.error(f"error sending {len(batch)} fcm messages: {e}")
+            continue
+
+        if response.failure_count:
+            for msg, resp in zip(batch, response.responses):
+                if not resp.success:
+                    logger.warning(f"fcm message to '{msg.token}' failed: {resp.exception}")
@@ -1,8 +1,11 @@
 from fastapi import Request, status
 from fastapi.responses import JSONResponse
+from starlette.background import BackgroundTask
+from starlette.concurrency import run_in_threadpool
 from starlette.middleware.base import BaseHTTPMiddleware
 
 from app.core.config import settings
+from app.core.fcm import FCMOutbox, _fcm_outbox, send_fcm_messages
 
 
 class APITokenMiddleware(BaseHTTPMiddleware):
@@ -44,3 +47,27 @@ class APITokenMiddleware(BaseHTTPMiddleware):
 
         # Protect all API v1 endpoints
         return path.startswith(f"{settings.API_V1_STR}/")
+
+
+class FCMOutboxMiddleware(BaseHTTPMiddleware):
+    """
+    Collect the firebase messages queued during a request
+    and send them in one batch once the response has been sent
+    """
+
+    async def dispatch(self, request: Request, call_next):
+        outbox = FCMOutbox()
+        reset_token = _fcm_outbox.set(outbox)
+        try:
+            response = await call_next(request)
+        finally:
+            _fcm_outbox.reset(reset_token)
+
+        response.background = BackgroundTask(self._flush, outbox)
+        return response
+
+    @staticmethod
+    async def _flush(outbox: FCMOutbox):
+        messages = outbox.drain()
+        if messages:
+            await run_in_threadpool(send_fcm_messages, messages)
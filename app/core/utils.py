@@ -1,6 +1,10 @@
-from typing import Generic, TypeVar
+import os
+import time
+import uuid
+from threading import Lock
+from typing import Any, Callable, Generic, Hashable, TypeVar
 
-from fastapi import Request
+from fastapi import Request, Response
 from furl import furl
 from pydantic import BaseModel
 from sqlalchemy.orm import Query
@@ -51,3 +55,59 @@ def paginate(query: Query[T], page: int, per_page: int, request: Request) -> Pag
         page=page,
         total_pages=total_pages,
     )
+
+
+def json_response(model: BaseModel) -> Response:
+    """
+    Serialize an already built (trusted) response model straight to JSON:
+    returning the model itself makes FastAPI dump it to python and validate it again
+    against the route's response_model (which is then only used for the docs)
+    """
+    return Response(content=model.model_dump_json(), media_type="application/json")
+
+
+class TTLCache:
+    """
+    Small per-process cache whose entries expire `ttl` seconds after being set
+    (cleared entirely when `maxsize` is reached)
+    """
+
+    def __init__(self, ttl: float, maxsize: int):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._data: dict[Hashable, tuple[float, Any]] = {}
+        self._lock = Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        entry = self._data.get(key)
+        if entry is None or entry[0] < time.monotonic():
+            return default
+        return entry[1]
+
+    def set(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            if len(self._data) >= self.maxsize:
+                self._data.clear()
+            self._data[key] = (time.monotonic() + self.ttl, value)
+
+    def discard(self, key: Hashable) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def discard_where(self, predicate: Callable[[Any], bool]) -> None:
+        """remove every entry whose value matches `predicate`"""
+        with self._lock:
+            for key in [key for key, (_, value) in self._data.items() if predicate(value)]:
+                del self._data[key]
+
+
+def uuid7() -> uuid.UUID:
+    """
+    Time-ordered UUID (RFC 9562 version 7): 48 bits of unix time in ms followed by random bits,
+    so new primary keys land at the right end of the btree index instead of a random page
+    """
+    value = (time.time_ns() // 1_000_000) << 80 | int.from_bytes(os.urandom(10))
+    # version 7 in bits 76-79, RFC 4122 variant (0b10) in bits 62-63
+    value = (value & ~(0xF << 76)) | (0x7 << 76)
+    value = (value & ~(0x3 << 62)) | (0x2 << 62)
+    return uuid.UUID(int=value)
@@ -10,11 +10,13 @@ from fastapi.staticfiles import StaticFiles
 from psycopg2.errors import UniqueViolation
 from pydantic_core import ValidationError
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import configure_mappers
 
 from firebase import init_firebase
 
 from .core.auth import CombinedAuthMiddleware
 from .core.config import settings
+from .core.middleware import FCMOutboxMiddleware
 from .cron_jobs import scheduler
 from .services.twilio_service import TwilioService
 
@@ -26,6 +28,9 @@ http_bearer = HTTPBearer(auto_error=False)
 # code to run before app startup & after app shutdown
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    # resolve every model relationship now rather than on the first request's query
+    configure_mappers()
+
     # firebase
     init_firebase()
     print("firebase initialized successfuly")
@@ -114,6 +119,9 @@ app.mount("/media", StaticFiles(directory="media"), name="media")
 # Add combined auth middleware (accepts API-Token or Bearer JWT)
 app.add_middleware(CombinedAuthMiddleware)
 
+# Batch firebase notifications queued during a request (sent after the response)
+app.add_middleware(FCMOutboxMiddleware)
+
 
 # exception handlers
 @app.exception_handler(IntegrityError)
@@ -1,21 +1,90 @@
-from enum import Enum, IntEnum
-from typing import Tuple
+import sys
+from enum import Enum
+from types import MappingProxyType
+from typing import Final, Mapping, Tuple
 
 
 class BaseStrEnum(str, Enum):
     def __new__(cls, value: str, label: str = None):
+        value = sys.intern(value)
         obj = str.__new__(cls, value)
         obj._value_ = value
-        obj._label_ = label or value
+        # stored on the member itself so reads are a plain instance-dict lookup
+        obj.__dict__["label"] = sys.intern(label or value)
         return obj
 
-    @property
-    def label(self) -> str:
-        return self._label_
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # members already exist here (python >= 3.11): build the options once per class
+        cls._options_ = tuple((member._value_, member.label) for member in cls.__members__.values())
+        cls._value_set_ = frozenset(member._value_ for member in cls.__members__.values())
 
+    @classmethod
+    def contains(cls, value) -> bool:
+        return value in cls._value_set_
+
+    @classmethod
+    def options(cls) -> list[Tuple[str, str]]:
+        return list(cls._options_)
+
+
+def enum_values(enum_cls: type[BaseStrEnum]) -> list[str]:
+    """values_callable for sqlalchemy.Enum: persist member values (not names)"""
+    return [member.value for member in enum_cls]
+
+
+class FieldOption(str):
+    """A single form field option: a plain str carrying its name and label"""
+
+    owner: str
+    name: str
+    value: str
+    label: str
+
+    def __repr__(self) -> str:
+        return f"<{self.owner}.{self.name}: {str.__repr__(self)}>"
+
+
+class FieldOptionsMeta(type):
+    """Lightweight enum-like metaclass for form field options (members built once, no EnumMeta)"""
+
+    def __new__(mcs, cls_name: str, bases: tuple, namespace: dict):
+        members: dict[str, FieldOption] = {}
+        for key, raw in list(namespace.items()):
+            if key.startswith("_") or not isinstance(raw, (str, tuple)):
+                continue
+            value, label = (raw, raw) if isinstance(raw, str) else (raw[0], raw[-1])
+            member = str.__new__(FieldOption, value)
+            member.__dict__.update(owner=cls_name, name=key, value=value, label=label)
+            namespace[key] = members[key] = member
+        namespace["__members__"] = MappingProxyType(members)
+        namespace["_value2member_map_"] = {member.value: member for member in members.values()}
+        namespace["_options_"] = tuple((member.value, member.label) for member in members.values())
+        return super().__new__(mcs, cls_name, bases, namespace)
+
+    def __iter__(cls):
+        return iter(cls.__members__.values())
+
+    def __len__(cls) -> int:
+        return len(cls.__members__)
+
+    def __contains__(cls, value) -> bool:
+        return value in cls._value2member_map_
+
+    def __getitem__(cls, name: str) -> FieldOption:
+        return cls.__members__[name]
+
+    def __call__(cls, value: str) -> FieldOption:
+        try:
+            return cls._value2member_map_[value]
+        except KeyError:
+            raise ValueError(f"{value!r} is not a valid {cls.__name__}") from None
+
+
+class FieldOptions(metaclass=FieldOptionsMeta):
     @classmethod
     def options(cls) -> list[Tuple[str, str]]:
-        return [(member.value, member.label) for member in cls]
+        return list(cls._options_)
 
 
 class SocialProviders(BaseStrEnum):
@@ -24,17 +93,17 @@ class SocialProviders(BaseStrEnum):
 
 
 # Form Fields Options
-class Gender(BaseStrEnum):
+class Gender(FieldOptions):
     HOMME = "homme", "Homme"
     FEMME = "femme", "Femme"
 
 
-class RelationshipGoal(BaseStrEnum):
+class RelationshipGoal(FieldOptions):
     MARIAGE = "mariage", "Te marier"
     RELATION_SERIEUSE = "relation_serieuse", "Une relation sérieuse mais pas forcément le mariage"
 
 
-class ProfessionalSituation(BaseStrEnum):
+class ProfessionalSituation(FieldOptions):
     ETUDIANT = "etudiant", "Étudiant(e)"
     SALARIE = "salarie", "Salarié(e)"
     INDEPENDANT = "independant", "Indépendant(e)"
@@ -42,7 +111,7 @@ class ProfessionalSituation(BaseStrEnum):
     RETRAITE = "retraite", "Retraité(e)"
 
 
-class EducationLevel(BaseStrEnum):
+class EducationLevel(FieldOptions):
     AUCUN_DIPLOME = "aucun_diplome", "Aucun diplôme"
     NIVEAU_LYCEE = "niveau_lycee", "Niveau lycée"
     BAC_OU_EQUIVALENT = "bac_ou_equivalent", "Bac ou équivalent"
@@ -51,45 +120,45 @@ class EducationLevel(BaseStrEnum):
     DOCTORAT_OU_PLUS = "doctorat_ou_plus", "Doctorat ou plus"
 
 
-class ReligiousPractice(BaseStrEnum):
+class ReligiousPractice(FieldOptions):
     OUI = "oui", "Oui"
     NON = "non", "Non"
     OCCASIONNELLEMENT = "occasionnellement", "Occasionnellement"
 
 
-class PartnerMustShareReligion(BaseStrEnum):
+class PartnerMustShareReligion(FieldOptions):
     OUI_ABSOLUMENT = "oui_absolument", "Oui, absolument"
     SERAIT_UN_PLUS = "serait_un_plus", "Ce serait un plus"
     PAS_NECESSAIRE = "pas_necessaire", "Non, ce n’est pas nécessaire"
 
 
-class FaithTransmissionToChildren(BaseStrEnum):
+class FaithTransmissionToChildren(FieldOptions):
     OUI = "oui", "Oui"
     NON = "non", "Non"
     JE_NE_SAIS_PAS_ENCORE = "je_ne_sais_pas_encore", "Je ne sais pas encore"
 
 
-class PartnerSameReligiousEducationVision(BaseStrEnum):
+class PartnerSameReligiousEducationVision(FieldOptions):
     OUI = "oui", "Oui"
     NON = "non", "Non"
     PEU_IMPORTE = "peu_importe", "Peu importe"
 
 
-class BodySize(BaseStrEnum):
+class BodySize(FieldOptions):
     THIN = "thin", "Mince"
     ATHLETIC = "athletic", "Athlétique"
     WITH_FORMS = "with_forms", "Avec Formes"
     DONT_CARE = "dont_care", "Peu Importe"
 
 
-class SportFrequency(BaseStrEnum):
+class SportFrequency(FieldOptions):
     JAMAIS = "jamais", "Jamais"
     _1_2_PAR_SEMAINE = "1_2_par_semaine", "1 à 2 fois par semaine"
     _3_5_PAR_SEMAINE = "3_5_par_semaine", "3 à 5 fois par semaine"
     TOUS_LES_JOURS = "tous_les_jours", "Tous les jours"
 
 
-class SpecificDietaryHabits(BaseStrEnum):
+class SpecificDietaryHabits(FieldOptions):
     AUCUNE = "aucune", "Aucune"
     VEGETARIEN = "vegetarien", "Végétarien(ne)"
     VEGAN = "vegan", "Vegan"
@@ -97,26 +166,26 @@ class SpecificDietaryHabits(BaseStrEnum):
     CASHER = "casher", "Casher"
 
 
-class HygieneTidinessApproach(BaseStrEnum):
+class HygieneTidinessApproach(FieldOptions):
     TRES_IMPORTANT = "tres_important", "Très important"
     IMPORTANT = "important", "Important"
     FLEXIBLE = "flexible", "Flexible"
     PAS_VRAIMENT = "pas_vraiment", "Je ne m’en préoccupe pas vraiment"
 
 
-class Smoker(BaseStrEnum):
+class Smoker(FieldOptions):
     OUI = "oui", "Oui"
     NON = "non", "Non"
     OCCASIONNELLEMENT = "occasionnellement", "Occasionnellement"
 
 
-class DrinksAlcohol(BaseStrEnum):
+class DrinksAlcohol(FieldOptions):
     OUI = "oui", "Oui"
     NON = "non", "Non"
     OCCASIONNELLEMENT = "occasionnellement", "Occasionnellement"
 
 
-class PartnerSportFrequency(BaseStrEnum):
+class PartnerSportFrequency(FieldOptions):
     JAMAIS = "jamais", "Jamais"
     _1_2_PAR_SEMAINE = "1_2_par_semaine", "1 à 2 fois par semaine"
     _3_5_PAR_SEMAINE = "3_5_par_semaine", "3 à 5 fois par semaine"
@@ -124,51 +193,51 @@ class PartnerSportFrequency(BaseStrEnum):
     PEU_IMPORTE = "peu_importe", "Peu importe"
 
 
-class PartnerSameDietaryHabits(BaseStrEnum):
+class PartnerSameDietaryHabits(FieldOptions):
     OUI = "oui", "Oui"
     NON_RESPECTE_CHOIX = "non_respecte_choix", "Non, tant qu’il/elle respecte mes choix"
     PEU_IMPORTE = "peu_importe", "Peu importe"
 
 
-class PartnerCleanlinessImportance(BaseStrEnum):
+class PartnerCleanlinessImportance(FieldOptions):
     TRES_IMPORTANT = "tres_important", "Très important"
     IMPORTANT = "important", "Important"
     FLEXIBLE = "flexible", "Flexible"
     PEU_IMPORTANT = "peu_important", "Peu important"
 
 
-class AcceptSmokerPartner(BaseStrEnum):
+class AcceptSmokerPartner(FieldOptions):
     OUI = "oui", "Oui"
     NON = "non", "Non"
     OCCASIONNELLEMENT_SEULEMENT = "occasionnellement_seulement", "Occasionnellement seulement"
 
 
-class AcceptAlcoholConsumerPartner(BaseStrEnum):
+class AcceptAlcoholConsumerPartner(FieldOptions):
     OUI = "oui", "Oui"
     NON = "non", "Non"
     OCCASIONNELLEMENT_SEULEMENT = "occasionnellement_seulement", "Occasionnellement seulement"
 
 
-class ReadyToLiveWithPet(BaseStrEnum):
+class ReadyToLiveWithPet(FieldOptions):
     OUI = "oui", "Oui"
     NON = "non", "Non"
     CA_DEPEND = "ca_depend"
 
 
-class PersonalityType(BaseStrEnum):
+class PersonalityType(FieldOptions):
     INTROVERTI = "introverti", "Introverti(e)"
     EXTRAVERTI = "extraverti", "Extraverti(e)"
     MELANGE_DES_DEUX = "melange_des_deux", "Un mélange des deux"
 
 
-class PartnerPersonalityPreference(BaseStrEnum):
+class PartnerPersonalityPreference(FieldOptions):
     INTROVERTI = "introverti", "Introverti(e)"
     EXTRAVERTI = "extraverti", "Extraverti(e)"
     AMBIVERT = "ambivert"
     PEU_IMPORTE = "peu_importe", "Peu importe"
 
 
-class PrimaryLoveLanguage(BaseStrEnum):
+class PrimaryLoveLanguage(FieldOptions):
     PAROLES_VALORISANTES = "paroles_valorisantes", "Paroles valorisantes"
     CONTACT_PHYSIQUE = "contact_physique", "Contact physique"
     TEMPS_DE_QUALITE = "temps_de_qualite", "Temps de qualité"
@@ -176,14 +245,14 @@ class PrimaryLoveLanguage(BaseStrEnum):
     SERVICES_RENDUS = "services_rendus", "Services rendus"
 
 
-class FriendsVisitFrequency(BaseStrEnum):
+class FriendsVisitFrequency(FieldOptions):
     TRES_SOUVENT = "tres_souvent", "Très souvent"
     REGULIEREMENT = "regulierement", "Régulièrement"
     OCCASIONNELLEMENT = "occasionnellement", "Occasionnellement"
     RAREMENT = "rarement", "Rarement"
 
 
-class ToleranceSocial(BaseStrEnum):
+class ToleranceSocial(FieldOptions):
     BESOIN_EQUILIBRE = "besoin_equilibre", "J’ai besoin d’équilibre"
     PAS_DERANGE_EPANOUI = (
         "pas_derange_epanoui",
@@ -192,33 +261,33 @@ class ToleranceSocial(BaseStrEnum):
     PREFERE_STYLE_PROCHE = "prefere_style_proche", "Je préfère un style de vie proche du mien"
 
 
-class ClothingStyle(BaseStrEnum):
+class ClothingStyle(FieldOptions):
     CLASSIQUE_ELEGANT = "classique_elegant", "Classique / Élégant"
     DECONTRACTE_SPORTIF = "decontracte_sportif", "Décontracté / Sportif"
     URBAIN_TENDANCE = "urbain_tendance", "Urbain / Tendance"
     CHANGEANT_HUMEUR = "changeant_humeur", "Changeant selon l’humeur"
 
 
-class PartnerClothingStyle(BaseStrEnum):
+class PartnerClothingStyle(FieldOptions):
     CLASSIC = "classic", "Classique"
     URBAIN = "urbain", "Urbain"
     TRENDING = "trending", "Tendance"
     DONT_CARE = "dont_care", "Peu Importe"
 
 
-class ImportanceOfAppearance(BaseStrEnum):
+class ImportanceOfAppearance(FieldOptions):
     TRES_IMPORTANTE = "tres_importante", "Très importante"
     MOYENNE = "moyenne", "Moyenne"
     PEU_IMPORTANTE = "peu_importante", "Peu importante"
 
 
-class PartnerHygieneAppearanceImportance(BaseStrEnum):
+class PartnerHygieneAppearanceImportance(FieldOptions):
     TRES_IMPORTANTE = "tres_importante", "Très importante"
     MOYENNE = "moyenne", "Moyenne"
     FAIBLE = "faible", "Faible"
 
 
-class ImportantPhysicalAspectsPartner(BaseStrEnum):
+class ImportantPhysicalAspectsPartner(FieldOptions):
     TAILLE = "taille", "Taille"
     CORPULENCE = "corpulence", "Corpulence"
     STYLE_VESTIMENTAIRE = "style_vestimentaire", "Style vestimentaire"
@@ -229,46 +298,46 @@ class ImportantPhysicalAspectsPartner(BaseStrEnum):
     )
 
 
-class ImportanceOfSexuality(BaseStrEnum):
+class ImportanceOfSexuality(FieldOptions):
     TRES_IMPORTANTE = "tres_importante", "Très importante"
     MOYENNE = "moyenne", "Moyenne"
     PEU_IMPORTANTE = "peu_importante", "Peu importante"
     PAS_IMPORTANTE_DU_TOUT = "pas_importante_du_tout", "Pas importante du tout"
 
 
-class IdealIntimateFrequency(BaseStrEnum):
+class IdealIntimateFrequency(FieldOptions):
     PLUSIEURS_FOIS_SEMAINE = "plusieurs_fois_semaine", "Plusieurs fois par semaine"
     _1_2_FOIS_SEMAINE = "1_2_fois_semaine", "1–2 fois par semaine"
     QUELQUES_FOIS_MOIS = "quelques_fois_mois", "Quelques fois par mois"
     PEU_OU_PAS_SOUVENT = "peu_ou_pas_souvent", "Peu ou pas souvent"
 
 
-class ComfortLevelTalkingSexuality(BaseStrEnum):
+class ComfortLevelTalkingSexuality(FieldOptions):
     TRES_A_LAISE = "tres_a_laise", "Très à l’aise"
     A_LAISE_SELON_PERSONNE = "a_laise_selon_personne", "À l’aise selon la personne"
     PEU_A_LAISE = "peu_a_laise", "Peu à l’aise"
     PAS_DU_TOUT_A_LAISE = "pas_du_tout_a_laise", "Pas du tout à l’aise"
 
 
-class PartnerSexualValuesAlignment(BaseStrEnum):
+class PartnerSexualValuesAlignment(FieldOptions):
     OUI = "oui", "Oui"
     NON_COMMUNIQUE = "non_communique", "Non, tant qu’on communique"
     PEU_IMPORTE = "peu_importe", "Peu importe"
 
 
-class ComfortablePublicAffection(BaseStrEnum):
+class ComfortablePublicAffection(FieldOptions):
     OUI = "oui", "Oui"
     OUI_DISCRETION = "oui_discretion", "Oui, mais avec discrétion"
     NON = "non", "Non"
 
 
-class PartnerSimilarityPreference(BaseStrEnum):
+class PartnerSimilarityPreference(FieldOptions):
     TRES_SIMILAIRE = "tres_similaire", "Très similaire à toi"
     PLUTOT_COMPLEMENTAIRE = "plutot_complementaire", "Plutôt complémentaire"
     BON_MELANGE = "bon_melange", "Un bon mélange des deux"
 
 
-class ImportanceFinancialSituationPartner(BaseStrEnum):
+class ImportanceFinancialSituationPartner(FieldOptions):
     TRES_IMPORTANTE_STABILITE = (
         "tres_importante_stabilite",
         "Très importante : je veux une stabilité financière claire",
@@ -281,7 +350,7 @@ class ImportanceFinancialSituationPartner(BaseStrEnum):
     PAS_DU_TOUT_IMPORTANTE = "pas_du_tout_importante", "Pas du tout importante"
 
 
-class IdealPartnerEducationProfession(BaseStrEnum):
+class IdealPartnerEducationProfession(FieldOptions):
     ETUDES_EQUIVALENTES_SUPERIEURES = (
         "etudes_equivalentes_superieures",
         "Un niveau d'études équivalent ou supérieur au tien",
@@ -297,21 +366,21 @@ class IdealPartnerEducationProfession(BaseStrEnum):
     PEU_IMPORTE_EPANOUI = "peu_importe_epanoui", "Peu importe, s’il/elle est épanoui(e)"
 
 
-class PartnerMustWantChildren(BaseStrEnum):
+class PartnerMustWantChildren(FieldOptions):
     OUI = "oui", "Oui"
     NON = "non", "Non"
     PAS_FORCEMENT = "pas_forcément", "Pas forcément"
 
 
 # Not used
-class PracticeLevel(BaseStrEnum):
+class PracticeLevel(FieldOptions):
     NOT_PRACTICING = "non_pratiquant"
     OCCASIONALLY = "occasionnellement"
     REGULARLY = "regulierement"
     STRICTLY = "strictement"
 
 
-class ComfortLevel(BaseStrEnum):
+class ComfortLevel(FieldOptions):
     VERY_UNCOMFORTABLE = "tres_inconfortable"
     UNCOMFORTABLE = "inconfortable"
     NEUTRAL = "neutre"
@@ -319,7 +388,7 @@ class ComfortLevel(BaseStrEnum):
     VERY_COMFORTABLE = "tres_confortable"
 
 
-class ImportanceLevel(BaseStrEnum):
+class ImportanceLevel(FieldOptions):
     NOT_IMPORTANT = "pas_important"
     SOMEWHAT_IMPORTANT = "peu_important"
     IMPORTANT = "important"
@@ -347,12 +416,22 @@ class SubscriptionType(BaseStrEnum):
     PREMIUM = "premium"
 
 
-class JourneyStep(IntEnum):
-    STEP1_PRE_COMPATIBILITY = 1
-    STEP2_PHOTOS_UNLOCKED = 2
-    STEP3_VOICE_VIDEO_CALL = 3
-    STEP4_PHYSICAL_MEETING = 4
-    STEP5_MEETING_FEEDBACK = 5
+# plain int constants: compared on every journey read, so no Enum overhead
+class JourneyStep:
+    STEP1_PRE_COMPATIBILITY: Final = 1
+    STEP2_PHOTOS_UNLOCKED: Final = 2
+    STEP3_VOICE_VIDEO_CALL: Final = 3
+    STEP4_PHYSICAL_MEETING: Final = 4
+    STEP5_MEETING_FEEDBACK: Final = 5
+
+
+JOURNEY_STEP_NAMES: dict[int, str] = {
+    JourneyStep.STEP1_PRE_COMPATIBILITY: "STEP1_PRE_COMPATIBILITY",
+    JourneyStep.STEP2_PHOTOS_UNLOCKED: "STEP2_PHOTOS_UNLOCKED",
+    JourneyStep.STEP3_VOICE_VIDEO_CALL: "STEP3_VOICE_VIDEO_CALL",
+    JourneyStep.STEP4_PHYSICAL_MEETING: "STEP4_PHYSICAL_MEETING",
+    JourneyStep.STEP5_MEETING_FEEDBACK: "STEP5_MEETING_FEEDBACK",
+}
 
 
 class MessageType(BaseStrEnum):
@@ -409,48 +488,49 @@ class TwilioEvent(BaseStrEnum):
     ON_CONVERSATION_STATE_UPDATED = "onConversationStateUpdated"
 
 
-def get_field_enum(field_name: str) -> BaseStrEnum | None:
-    return fields_enums.get(field_name)
-
-
-fields_enums = {
-    "gender": Gender,
-    "relationship_goal": RelationshipGoal,
-    "professional_situation": ProfessionalSituation,
-    "education_level": EducationLevel,
-    "religious_practice": ReligiousPractice,
-    "partner_must_share_religion": PartnerMustShareReligion,
-    "faith_transmission_to_children": FaithTransmissionToChildren,
-    "partner_same_religious_education_vision": PartnerSameReligiousEducationVision,
-    "sport_frequency": SportFrequency,
-    "specific_dietary_habits": SpecificDietaryHabits,
-    "hygiene_tidiness_approach": HygieneTidinessApproach,
-    "smoker": Smoker,
-    "drinks_alcohol": DrinksAlcohol,
-    "partner_sport_frequency": PartnerSportFrequency,
-    "partner_same_dietary_habits": PartnerSameDietaryHabits,
-    "partner_cleanliness_importance": PartnerCleanlinessImportance,
-    "accept_smoker_partner": AcceptSmokerPartner,
-    "accept_alcohol_consumer_partner": AcceptAlcoholConsumerPartner,
-    "ready_to_live_with_pet": ReadyToLiveWithPet,
-    "personality_type": PersonalityType,
-    "partner_personality_preference": PartnerPersonalityPreference,
-    "primary_love_language": PrimaryLoveLanguage,
-    "friends_visit_frequency": FriendsVisitFrequency,
-    "clothing_style": ClothingStyle,
-    "appearance_importance": ImportanceOfAppearance,
-    "partner_hygiene_appearance_importance": PartnerHygieneAppearanceImportance,
-    "important_physical_aspects_partner": ImportantPhysicalAspectsPartner,
-    "importance_of_sexuality": ImportanceOfSexuality,
-    "ideal_intimate_frequency": IdealIntimateFrequency,
-    "comfort_level_talking_sexuality": ComfortLevelTalkingSexuality,
-    "partner_sexual_values_alignment": PartnerSexualValuesAlignment,
-    "comfortable_public_affection": ComfortablePublicAffection,
-    "partner_similarity_preference": PartnerSimilarityPreference,
-    "importance_financial_situation_partner": ImportanceFinancialSituationPartner,
-    "ideal_partner_education_profession": IdealPartnerEducationProfession,
-    "partner_must_want_children": PartnerMustWantChildren,
-    "tolerance_social_vs_homebody": ToleranceSocial,
-    "partner_body_size": BodySize,
-    "partner_clothing_style": PartnerClothingStyle,
-}
+fields_enums: Mapping[str, type[FieldOptions]] = MappingProxyType(
+    {
+        "gender": Gender,
+        "relationship_goal": RelationshipGoal,
+        "professional_situation": ProfessionalSituation,
+        "education_level": EducationLevel,
+        "religious_practice": ReligiousPractice,
+        "partner_must_share_religion": PartnerMustShareReligion,
+        "faith_transmission_to_children": FaithTransmissionToChildren,
+        "partner_same_religious_education_vision": PartnerSameReligiousEducationVision,
+        "sport_frequency": SportFrequency,
+        "specific_dietary_habits": SpecificDietaryHabits,
+        "hygiene_tidiness_approach": HygieneTidinessApproach,
+        "smoker": Smoker,
+        "drinks_alcohol": DrinksAlcohol,
+        "partner_sport_frequency": PartnerSportFrequency,
+        "partner_same_dietary_habits": PartnerSameDietaryHabits,
+        "partner_cleanliness_importance": PartnerCleanlinessImportance,
+        "accept_smoker_partner": AcceptSmokerPartner,
+        "accept_alcohol_consumer_partner": AcceptAlcoholConsumerPartner,
+        "ready_to_live_with_pet": ReadyToLiveWithPet,
+        "personality_type": PersonalityType,
+        "partner_personality_preference": PartnerPersonalityPreference,
+        "primary_love_language": PrimaryLoveLanguage,
+        "friends_visit_frequency": FriendsVisitFrequency,
+        "clothing_style": ClothingStyle,
+        "appearance_importance": ImportanceOfAppearance,
+        "partner_hygiene_appearance_importance": PartnerHygieneAppearanceImportance,
+        "important_physical_aspects_partner": ImportantPhysicalAspectsPartner,
+        "importance_of_sexuality": ImportanceOfSexuality,
+        "ideal_intimate_frequency": IdealIntimateFrequency,
+        "comfort_level_talking_sexuality": ComfortLevelTalkingSexuality,
+        "partner_sexual_values_alignment": PartnerSexualValuesAlignment,
+        "comfortable_public_affection": ComfortablePublicAffection,
+        "partner_similarity_preference": PartnerSimilarityPreference,
+        "importance_financial_situation_partner": ImportanceFinancialSituationPartner,
+        "ideal_partner_education_profession": IdealPartnerEducationProfession,
+        "partner_must_want_children": PartnerMustWantChildren,
+        "tolerance_social_vs_homebody": ToleranceSocial,
+        "partner_body_size": BodySize,
+        "partner_clothing_style": PartnerClothingStyle,
+    }
+)
+
+# bound lookup: get_field_enum(field_name) -> FieldOptions subclass | None
+get_field_enum = fields_enums.get
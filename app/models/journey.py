@@ -2,12 +2,12 @@ from datetime import datetime
 from typing import TYPE_CHECKING
 from uuid import UUID
 
-from sqlalchemy import DateTime, ForeignKey
+from sqlalchemy import CheckConstraint, DateTime, ForeignKey, Index, text
 from sqlalchemy.dialects.postgresql import UUID as pgUUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
-from app.models.enums import JourneyStatus, JourneyStep
+from app.models.enums import JourneyStatus
 
 if TYPE_CHECKING:
     from .match import Match
@@ -21,13 +21,20 @@ class Journey(Base):
     """
 
     __tablename__ = "journey"
+    __table_args__ = (
+        # steps 1..5, and 6 once both users accepted the final step
+        CheckConstraint("current_step BETWEEN 1 AND 6", name="valid_current_step"),
+        Index("ix_journey_active", "current_step", postgresql_where=text("is_completed = false")),
+    )
+    __repr_fields__ = ("match_id", "current_step")
 
     match_id: Mapped[UUID] = mapped_column(
         pgUUID(as_uuid=True), ForeignKey("match.id"), unique=True, index=True
     )
-    current_step: Mapped[int] = mapped_column(default=JourneyStep.STEP1_PRE_COMPATIBILITY)
-    user1_accepted: Mapped[bool] = mapped_column(default=False, server_default="false")
-    user2_accepted: Mapped[bool] = mapped_column(default=False, server_default="false")
+    # plain int default (JourneyStep.STEP1_PRE_COMPATIBILITY)
+    current_step: Mapped[int] = mapped_column(server_default=text("1"))
+    user1_accepted: Mapped[bool] = mapped_column(server_default=text("false"))
+    user2_accepted: Mapped[bool] = mapped_column(server_default=text("false"))
 
     # Pré-compatibilité
     step1_completed_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
@@ -40,12 +47,12 @@ class Journey(Base):
     # Bilan rencontre
     step5_completed_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
 
-    status: Mapped[str] = mapped_column(
-        default=JourneyStatus.ACTIVE, server_default=JourneyStatus.ACTIVE
-    )
-    is_completed: Mapped[bool] = mapped_column(default=False)
+    status: Mapped[str] = mapped_column(server_default=JourneyStatus.ACTIVE)
+    is_completed: Mapped[bool] = mapped_column(server_default=text("false"))
     completed_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
-    ended_by: Mapped[UUID | None] = mapped_column(pgUUID(as_uuid=True), ForeignKey("user.id"))
+    ended_by: Mapped[UUID | None] = mapped_column(
+        pgUUID(as_uuid=True), ForeignKey("user.id"), index=True
+    )
     end_reason: Mapped[str | None]
     ended_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
 
@@ -57,6 +64,3 @@ class Journey(Base):
     meeting_requests: Mapped[list["MeetingRequest"]] = relationship(
         back_populates="journey", foreign_keys="MeetingRequest.journey_id"
     )
-
-    def __repr__(self):
-        return f"<Journey {self.id}: Match {self.match_id}, Step: {self.current_step}>"
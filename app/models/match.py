@@ -1,12 +1,12 @@
 from typing import TYPE_CHECKING, Optional
 from uuid import UUID
 
-from sqlalchemy import ForeignKey, UniqueConstraint
+from sqlalchemy import Enum, ForeignKey, Index, UniqueConstraint, text
 from sqlalchemy.dialects.postgresql import UUID as pgUUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
-from app.models.enums import MatchStatus
+from app.models.enums import MatchStatus, enum_values
 
 if TYPE_CHECKING:
     from .journey import Journey
@@ -19,14 +19,22 @@ class Match(Base):
     """
 
     __tablename__ = "match"
-    __table_args__ = (UniqueConstraint("user1_id", "user2_id", name="unique_match"),)
+    __table_args__ = (
+        UniqueConstraint("user1_id", "user2_id", name="unique_match"),
+        Index("ix_match_user1_status_score", "user1_id", "status", "compatibility_score"),
+        Index("ix_match_user2_status_score", "user2_id", "status", "compatibility_score"),
+    )
+    __repr_fields__ = ("user1_id", "user2_id", "compatibility_score")
 
     user1_id: Mapped[UUID] = mapped_column(pgUUID(as_uuid=True), ForeignKey("user.id"), index=True)
     user2_id: Mapped[UUID] = mapped_column(pgUUID(as_uuid=True), ForeignKey("user.id"), index=True)
     compatibility_score: Mapped[float]
-    status: Mapped[str] = mapped_column(default=MatchStatus.PENDING)
-    user1_accepted: Mapped[bool] = mapped_column(default=False)
-    user2_accepted: Mapped[bool] = mapped_column(default=False)
+    status: Mapped[MatchStatus] = mapped_column(
+        Enum(MatchStatus, name="match_status", values_callable=enum_values),
+        server_default=text(f"'{MatchStatus.PENDING.value}'"),
+    )
+    user1_accepted: Mapped[bool] = mapped_column(server_default=text("false"))
+    user2_accepted: Mapped[bool] = mapped_column(server_default=text("false"))
 
     # Relationships
     user1: Mapped["User"] = relationship(back_populates="matches_as_user1", foreign_keys=[user1_id])
@@ -35,8 +43,5 @@ class Match(Base):
         back_populates="match", uselist=False, foreign_keys="Journey.match_id"
     )
 
-    def __repr__(self):
-        return f"<Match {self.id}: {self.user1_id} - {self.user2_id}, Score: {self.compatibility_score}>"
-
     def get_other_user(self, user_id: UUID) -> "User":
         return self.user1 if user_id == self.user2_id else self.user2
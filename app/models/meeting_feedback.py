@@ -18,6 +18,7 @@ class MeetingFeedback(Base):
     """
 
     __tablename__ = "meeting_feedback"
+    __repr_fields__ = ("meeting_request_id", "rating")
 
     meeting_request_id: Mapped[UUID] = mapped_column(
         pgUUID(as_uuid=True), ForeignKey("meeting_request.id"), index=True
@@ -33,8 +34,3 @@ class MeetingFeedback(Base):
         back_populates="feedback", foreign_keys=[meeting_request_id]
     )
     user: Mapped["User"] = relationship(back_populates="meeting_feedbacks", foreign_keys=[user_id])
-
-    def __repr__(self):
-        return (
-            f"<MeetingFeedback {self.id}: Meeting {self.meeting_request_id}, Rating: {self.rating}>"
-        )
@@ -2,12 +2,12 @@ from datetime import datetime
 from typing import TYPE_CHECKING
 from uuid import UUID
 
-from sqlalchemy import DateTime, ForeignKey
+from sqlalchemy import DateTime, Enum, ForeignKey
 from sqlalchemy.dialects.postgresql import UUID as pgUUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
-from app.models.enums import MeetingStatus
+from app.models.enums import MeetingStatus, enum_values
 
 if TYPE_CHECKING:
     from .journey import Journey
@@ -21,15 +21,21 @@ class MeetingRequest(Base):
     """
 
     __tablename__ = "meeting_request"
+    __repr_fields__ = ("journey_id", "status")
 
     journey_id: Mapped[UUID] = mapped_column(
         pgUUID(as_uuid=True), ForeignKey("journey.id"), index=True
     )
-    requested_by: Mapped[UUID] = mapped_column(pgUUID(as_uuid=True), ForeignKey("user.id"))
+    requested_by: Mapped[UUID] = mapped_column(
+        pgUUID(as_uuid=True), ForeignKey("user.id"), index=True
+    )
 
     proposed_date: Mapped[datetime] = mapped_column(DateTime(timezone=True))
     proposed_location: Mapped[str]
-    status: Mapped[str] = mapped_column(default=MeetingStatus.PROPOSED)
+    status: Mapped[MeetingStatus] = mapped_column(
+        Enum(MeetingStatus, name="meeting_status", values_callable=enum_values),
+        default=MeetingStatus.PROPOSED.value,
+    )
     confirmed_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
 
     # Relationships
@@ -44,6 +50,3 @@ class MeetingRequest(Base):
         uselist=False,
         foreign_keys="MeetingFeedback.meeting_request_id",
     )
-
-    def __repr__(self):
-        return f"<MeetingRequest {self.id}: Journey {self.journey_id}, Status: {self.status}>"
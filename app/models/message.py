@@ -3,13 +3,13 @@ from typing import TYPE_CHECKING, Optional
 from uuid import UUID
 
 from firebase_admin import messaging
-from sqlalchemy import DateTime, ForeignKey, Text, text
+from sqlalchemy import DateTime, Enum, ForeignKey, Index, Text, func, text
 from sqlalchemy.dialects.postgresql import UUID as pgUUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
-from app.core.security import utc_now
-from app.models.enums import MessageType
+from app.core.fcm import queue_fcm_message
+from app.models.enums import MessageType, enum_values
 
 if TYPE_CHECKING:
     from .journey import Journey
@@ -22,23 +22,47 @@ class Message(Base):
     """
 
     __tablename__ = "message"
+    __table_args__ = (
+        Index("ix_message_journey_sent", "journey_id", text("sent_at DESC")),
+        Index(
+            "ix_message_unread",
+            "journey_id",
+            postgresql_where=text("is_read = false AND is_deleted = false"),
+        ),
+        Index(
+            "ix_message_flagged",
+            text("created_at DESC"),
+            postgresql_where=text("is_flagged IS true"),
+        ),
+        # append-only table: rows are physically in created_at order (admin "last week" stats)
+        Index(
+            "ix_message_created_brin",
+            "created_at",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
+    )
+    __repr_fields__ = ("journey_id", "sender_id")
 
     journey_id: Mapped[UUID] = mapped_column(
         pgUUID(as_uuid=True), ForeignKey("journey.id"), index=True
     )
 
     sender_id: Mapped[Optional[UUID]] = mapped_column(
-        pgUUID(as_uuid=True), ForeignKey("user.id"), nullable=True
+        pgUUID(as_uuid=True), ForeignKey("user.id"), nullable=True, index=True
     )
 
     content: Mapped[str] = mapped_column(Text)
-    message_type: Mapped[str] = mapped_column(default=MessageType.TEXT)
+    message_type: Mapped[MessageType] = mapped_column(
+        Enum(MessageType, name="message_type", values_callable=enum_values),
+        default=MessageType.TEXT.value,
+    )
 
-    is_read: Mapped[bool] = mapped_column(default=False)
-    is_flagged: Mapped[bool] = mapped_column(default=False, server_default=text("false"))
-    sent_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=utc_now)
+    is_read: Mapped[bool] = mapped_column(server_default=text("false"))
+    is_flagged: Mapped[bool] = mapped_column(server_default=text("false"))
+    sent_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
     moderated_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
-    is_deleted: Mapped[bool] = mapped_column(default=False, server_default=text("false"))
+    is_deleted: Mapped[bool] = mapped_column(server_default=text("false"))
     deleted_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
     twilio_msg_id: Mapped[str | None]
 
@@ -48,39 +72,18 @@ class Message(Base):
         back_populates="sent_messages", foreign_keys=[sender_id]
     )
 
-    def __repr__(self):
-        return f"<Message {self.id}: Journey {self.journey_id}, Sender {self.sender_id}>"
-
-    def get_twilio_msg(self):
-        from app.services.twilio_service import TwilioService
-
-        conv = TwilioService().chat_service.conversations(self.journey_id)
-        return conv.messages(self.twilio_msg_id).fetch()
-
-    def send_notif_to_receiver(self, title: str):
-        receiver = self.journey.match.get_other_user(self.sender_id)
-        if receiver.firebase_token and receiver.is_active and not receiver.is_deleted:
-            twilio_msg = self.get_twilio_msg()
+    def send_notif_to_receiver(self, title: str, receiver_token: str | None):
+        """receiver_token: the other user's firebase token (None if they can't be notified)"""
+        if receiver_token:
+            # ids only: the client fetches the message itself when the notification is opened
             message = messaging.Message(
-                token=receiver.firebase_token,
+                token=receiver_token,
                 notification=messaging.Notification(title=title, body=self.content),
                 data={
-                    "account_sid": str(twilio_msg.account_sid),
-                    "attributes": str(twilio_msg.attributes),
-                    "author": str(twilio_msg.author),
-                    "body": str(twilio_msg.body),
-                    "chat_service_sid": str(twilio_msg.chat_service_sid),
-                    "content_sid": str(twilio_msg.content_sid),
-                    "conversation_sid": str(twilio_msg.conversation_sid),
-                    "date_created": str(twilio_msg.date_created),
-                    "date_updated": str(twilio_msg.date_updated),
-                    "delivery": str(twilio_msg.delivery),
-                    "index": str(twilio_msg.index),
-                    "media": str(twilio_msg.media),
-                    "participant_sid": str(twilio_msg.participant_sid),
-                    "sid": str(twilio_msg.sid),
-                    "url": str(twilio_msg.url),
+                    "message_id": str(self.id),
+                    "journey_id": str(self.journey_id),
+                    "type": "new_message",
                 },
             )
 
-            messaging.send(message)
+            queue_fcm_message(message)
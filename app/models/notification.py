@@ -2,11 +2,12 @@ from typing import TYPE_CHECKING
 from uuid import UUID
 
 from firebase_admin import messaging
-from sqlalchemy import ForeignKey
+from sqlalchemy import ForeignKey, Index, text
 from sqlalchemy.dialects.postgresql import UUID as pgUUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
+from app.core.fcm import queue_fcm_message
 
 if TYPE_CHECKING:
     from .user import User
@@ -18,6 +19,9 @@ class Notification(Base):
     """
 
     __tablename__ = "notification"
+    __table_args__ = (
+        Index("ix_notification_user_unready", "user_id", postgresql_where=text("is_ready = false")),
+    )
     user_id: Mapped[UUID] = mapped_column(
         pgUUID(as_uuid=True),
         ForeignKey("user.id", ondelete="CASCADE"),
@@ -41,4 +45,4 @@ class Notification(Base):
                 notification=messaging.Notification(title=self.title, body=self.body),
                 data=data or {},
             )
-            messaging.send(message)
+            queue_fcm_message(message)
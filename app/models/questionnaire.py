@@ -1,11 +1,12 @@
 from datetime import datetime
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, ClassVar, Optional
 from uuid import UUID
 
 from sqlalchemy import DateTime, ForeignKey
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.dialects.postgresql import UUID as pgUUID
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.orm import Mapped, load_only, mapped_column, relationship
+from sqlalchemy.orm.interfaces import ORMOption
 
 from app.core.database import Base
 
@@ -19,6 +20,12 @@ class Questionnaire(Base):
     """
 
     __tablename__ = "questionnaire"
+    __repr_fields__ = ("first_name", "age")
+
+    # columns that are not questionnaire answers
+    _FIELDS_TO_EXCLUDE: ClassVar[frozenset[str]] = frozenset(
+        {"id", "user_id", "completed_at", "created_at", "updated_at"}
+    )
 
     user_id: Mapped[UUID] = mapped_column(
         pgUUID(as_uuid=True),
@@ -139,9 +146,11 @@ class Questionnaire(Base):
         """Check if some field is answered in this Questionnaire"""
         return getattr(self, field_name, None) not in [None, "", []]
 
-    def __repr__(self) -> str:
-        return f"<Questionnaire {self.id}: {self.first_name}, {self.age}>"
+    @classmethod
+    def fields_to_exclude(cls) -> frozenset[str]:
+        return cls._FIELDS_TO_EXCLUDE
 
     @classmethod
-    def fields_to_exclude(cls) -> list[str]:
-        return ["id", "user_id", "completed_at", "created_at", "updated_at"]
+    def load_only_for(cls, *names: str) -> ORMOption:
+        """Loader option that only fetches the given columns (the others are deferred)"""
+        return load_only(*(getattr(cls, name) for name in names))
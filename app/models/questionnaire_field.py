@@ -1,13 +1,13 @@
 from typing import TYPE_CHECKING, Optional
 from uuid import UUID
 
-from sqlalchemy import ForeignKey, Text
+from sqlalchemy import Enum, ForeignKey, Text
 from sqlalchemy.dialects.postgresql import UUID as pgUUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
 
-from .enums import FieldType
+from .enums import FieldType, enum_values
 
 if TYPE_CHECKING:
     from .questionnaire_subcategory import QuestionnaireSubCategory
@@ -24,7 +24,10 @@ class QuestionnaireField(Base):
     label: Mapped[str]
     description: Mapped[str] = mapped_column(Text, default="")
     order_position: Mapped[int] = mapped_column(default=0)
-    field_type: Mapped[str] = mapped_column(default=FieldType.TEXT)
+    field_type: Mapped[FieldType] = mapped_column(
+        Enum(FieldType, name="field_type", values_callable=enum_values),
+        default=FieldType.TEXT.value,
+    )
     field_unit: Mapped[Optional[str]]
     placeholder: Mapped[Optional[str]]
     required: Mapped[bool] = mapped_column(default=False)
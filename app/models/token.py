@@ -1,7 +1,7 @@
 from datetime import datetime
 from uuid import UUID
 
-from sqlalchemy import DateTime, ForeignKey
+from sqlalchemy import DateTime, ForeignKey, Index, text
 from sqlalchemy.dialects.postgresql import UUID as pgUUID
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -14,6 +14,10 @@ class RefreshToken(Base):
     """
 
     __tablename__ = "refresh_token"
+    __table_args__ = (
+        # only live tokens are looked up on refresh: keeps this index at ~ active users size
+        Index("ix_refresh_token_active", "token", postgresql_where=text("is_revoked IS false")),
+    )
 
     user_id: Mapped[UUID] = mapped_column(
         pgUUID(as_uuid=True),
@@ -2,11 +2,12 @@ from datetime import datetime
 from typing import TYPE_CHECKING, Optional
 
 from firebase_admin import messaging
-from sqlalchemy import CheckConstraint, DateTime, UniqueConstraint, text
+from sqlalchemy import CheckConstraint, DateTime, Enum, UniqueConstraint, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
-from app.models.enums import SubscriptionType
+from app.core.fcm import queue_fcm_message
+from app.models.enums import SocialProviders, SubscriptionType, enum_values
 
 if TYPE_CHECKING:
     from .match import Match
@@ -34,17 +35,21 @@ class User(Base):
         ),
         UniqueConstraint("social_provider", "social_id", name="unique_social_account"),
     )
+    __repr_fields__ = ("phone_region", "phone_number")
 
     phone_region: Mapped[Optional[str]] = mapped_column(nullable=True)
     phone_number: Mapped[Optional[str]] = mapped_column(nullable=True, index=True)
     email: Mapped[Optional[str]]
     password: Mapped[Optional[str]]
     name: Mapped[Optional[str]] = mapped_column(unique=True, index=True)
-    profile_image: Mapped[Optional[str]] = mapped_column(unique=True, index=True)
+    profile_image: Mapped[Optional[str]]
     has_completed_questionnaire: Mapped[bool] = mapped_column(default=False)
 
     # subscription
-    subscription_type: Mapped[str] = mapped_column(default=SubscriptionType.FREE)
+    subscription_type: Mapped[SubscriptionType] = mapped_column(
+        Enum(SubscriptionType, name="subscription_type", values_callable=enum_values),
+        default=SubscriptionType.FREE.value,
+    )
     subscription_expires_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
 
     # account management
@@ -62,7 +67,9 @@ class User(Base):
     last_login: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
 
     # OAuth
-    social_provider: Mapped[Optional[str]]
+    social_provider: Mapped[Optional[SocialProviders]] = mapped_column(
+        Enum(SocialProviders, name="social_provider", values_callable=enum_values)
+    )
     social_id: Mapped[Optional[str]]
     social_image: Mapped[Optional[str]]
 
@@ -97,9 +104,6 @@ class User(Base):
         back_populates="user", foreign_keys="Notification.user_id"
     )
 
-    def __repr__(self) -> str:
-        return f"<User {self.id}: {self.phone_region} {self.phone_number}>"
-
     def send_new_video_call_notif(self, room_name: str, video_token: str):
         if self.firebase_token and self.is_active and not self.is_deleted:
             msg = messaging.Message(
@@ -107,4 +111,4 @@ class User(Base):
                 notification=messaging.Notification(title="New Call"),
                 data={"room_name": room_name, "video_token": video_token},
             )
-        messaging.send(msg)
+            queue_fcm_message(msg)
@@ -36,7 +36,7 @@ class AdminLoginRequest(BaseModel):
 
 
 class AuthResponse(BaseModel):
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, frozen=True)
     user_id: str
     phone_region: Optional[str] = None
     phone_number: Optional[str] = None
@@ -82,7 +82,7 @@ class CompleteProfileResponse(BaseModel):
 
 
 class TokenResponse(BaseModel):
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, frozen=True)
     access_token: str
     refresh_token: str
     token_type: str = "bearer"
@@ -4,7 +4,7 @@ from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, Field, field_validator
 
-from app.models.enums import JourneyStep
+from app.models.enums import JOURNEY_STEP_NAMES, JourneyStep
 
 
 class JourneyBase(BaseModel):
@@ -20,10 +20,8 @@ class JourneyBase(BaseModel):
 
     @field_validator("current_step")
     def validate_current_step(cls, v):
-        if v not in [step.value for step in JourneyStep]:
-            raise ValueError(
-                f"Invalid journey step. Must be one of: {[step.value for step in JourneyStep]}"
-            )
+        if v not in JOURNEY_STEP_NAMES:
+            raise ValueError(f"Invalid journey step. Must be one of: {list(JOURNEY_STEP_NAMES)}")
         return v
 
 
@@ -54,10 +52,8 @@ class JourneyUpdate(BaseModel):
 
     @field_validator("current_step")
     def validate_current_step(cls, v):
-        if v is not None and v not in [step.value for step in JourneyStep]:
-            raise ValueError(
-                f"Invalid journey step. Must be one of: {[step.value for step in JourneyStep]}"
-            )
+        if v is not None and v not in JOURNEY_STEP_NAMES:
+            raise ValueError(f"Invalid journey step. Must be one of: {list(JOURNEY_STEP_NAMES)}")
         return v
 
 
@@ -77,8 +73,7 @@ class JourneyInDBBase(JourneyBase):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class JourneyInDB(JourneyInDBBase):
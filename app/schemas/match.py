@@ -21,12 +21,6 @@ class MatchBase(BaseModel):
     user1_accepted: bool = Field(default=False)
     user2_accepted: bool = Field(default=False)
 
-    @field_validator("compatibility_score")
-    def validate_compatibility_score(cls, v):
-        if v < 0.0 or v > 100.0:
-            raise ValueError("Compatibility score must be between 0 and 100")
-        return v
-
 
 class MatchCreate(MatchBase):
     """
@@ -40,29 +34,20 @@ class MatchCreateRequest(BaseModel):
     """
     Schema for manual match creation between two users
     """
-    
+
     model_config = ConfigDict(from_attributes=True)
-    
+
     user1_id: UUID = Field(description="ID of the first user")
-    user2_id: UUID = Field(description="ID of the second user") 
+    user2_id: UUID = Field(description="ID of the second user")
     compatibility_score: float = Field(
-        default=50.0,
-        ge=0.0,
-        le=100.0,
-        description="Compatibility score between users (0-100)"
+        default=50.0, ge=0.0, le=100.0, description="Compatibility score between users (0-100)"
     )
-    
+
     @field_validator("user1_id", "user2_id")
     def validate_user_ids(cls, v):
         if not v:
             raise ValueError("User ID cannot be empty")
         return v
-    
-    @field_validator("compatibility_score")
-    def validate_compatibility_score_create(cls, v):
-        if v < 0.0 or v > 100.0:
-            raise ValueError("Compatibility score must be between 0 and 100")
-        return v
 
 
 class MatchUpdate(BaseModel):
@@ -70,6 +55,9 @@ class MatchUpdate(BaseModel):
     Schema for match update
     """
 
+    # not used by any route yet: build the validator on first use instead of at import
+    model_config = ConfigDict(defer_build=True)
+
     status: Optional[MatchStatus] = None
 
 
@@ -82,8 +70,7 @@ class MatchInDBBase(MatchBase):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class MatchInDB(MatchInDBBase):
@@ -99,7 +86,7 @@ class MatchOut(BaseModel):
     Schema for detailed match response with user information
     """
 
-    model_config = ConfigDict(from_attributes=True, validate_by_name=True)
+    model_config = ConfigDict(from_attributes=True, validate_by_name=True, frozen=True)
 
     id: UUID
     user1_id: UUID
@@ -110,14 +97,19 @@ class MatchOut(BaseModel):
     updated_at: datetime
     user1_accepted: bool = Field(default=False)
     user2_accepted: bool = Field(default=False)
-    journey_id: Optional[UUID] = Field(default=None, description="ID of the journey created when both users accept the match")
-    
+    journey_id: Optional[UUID] = Field(
+        default=None, description="ID of the journey created when both users accept the match"
+    )
+
     @classmethod
     def from_match(cls, match):
-        """Create MatchOut from Match model, including journey_id if available"""
+        """
+        Create MatchOut from Match model, including journey_id if available.
+        Built without validation: every value comes straight from the database
+        """
         journey_id = match.journey.id if match.journey else None
-        
-        return cls(
+
+        return cls.model_construct(
             id=match.id,
             user1_id=match.user1_id,
             user2_id=match.user2_id,
@@ -127,5 +119,5 @@ class MatchOut(BaseModel):
             updated_at=match.updated_at,
             user1_accepted=match.user1_accepted,
             user2_accepted=match.user2_accepted,
-            journey_id=journey_id
+            journey_id=journey_id,
         )
@@ -19,15 +19,7 @@ class MeetingRequestBase(BaseModel):
     requested_by: UUID
     proposed_date: datetime
     proposed_location: str
-    status: str = Field(default=MeetingStatus.PROPOSED.value)
-
-    @field_validator("status")
-    def validate_status(cls, v):
-        if v not in [status.value for status in MeetingStatus]:
-            raise ValueError(
-                f"Invalid meeting status. Must be one of: {[status.value for status in MeetingStatus]}"
-            )
-        return v
+    status: MeetingStatus = MeetingStatus.PROPOSED
 
     @field_validator("proposed_date")
     def validate_proposed_date(cls, v):
@@ -49,17 +41,12 @@ class MeetingRequestUpdate(BaseModel):
     Schema for meeting request update
     """
 
+    # not used by any route yet: build the validator on first use instead of at import
+    model_config = ConfigDict(defer_build=True)
+
     proposed_date: Optional[datetime] = None
     proposed_location: Optional[str] = None
-    status: Optional[str] = None
-
-    @field_validator("status")
-    def validate_status(cls, v):
-        if v is not None and v not in [status.value for status in MeetingStatus]:
-            raise ValueError(
-                f"Invalid meeting status. Must be one of: {[status.value for status in MeetingStatus]}"
-            )
-        return v
+    status: Optional[MeetingStatus] = None
 
     @field_validator("proposed_date")
     def validate_proposed_date(cls, v):
@@ -78,8 +65,7 @@ class MeetingRequestInDBBase(MeetingRequestBase):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class MeetingRequestInDB(MeetingRequestInDBBase):
@@ -109,12 +95,6 @@ class MeetingFeedbackBase(BaseModel):
     feedback: Optional[str] = None
     wants_to_continue: bool
 
-    @field_validator("rating")
-    def validate_rating(cls, v):
-        if v < 1 or v > 5:
-            raise ValueError("Rating must be between 1 and 5")
-        return v
-
 
 class MeetingFeedbackCreate(MeetingFeedbackBase):
     """
@@ -133,8 +113,7 @@ class MeetingFeedbackInDBBase(MeetingFeedbackBase):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class MeetingFeedbackInDB(MeetingFeedbackInDBBase):
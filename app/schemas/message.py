@@ -2,10 +2,8 @@ from datetime import datetime
 from typing import Optional
 from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict, ValidationInfo, field_validator
+from pydantic import BaseModel, ConfigDict
 
-from app.core.database import Session
-from app.models import Photo, Questionnaire
 from app.models.enums import MessageType
 
 
@@ -25,7 +23,8 @@ class MessageCreate(MessageBase):
     Schema for message creation
     """
 
-    pass
+    # not used by any route yet: build the validator on first use instead of at import
+    model_config = ConfigDict(defer_build=True)
 
 
 class MessageInDBBase(MessageBase):
@@ -58,6 +57,13 @@ class Sender(BaseModel):
     avatar: Optional[str] = None
 
 
+# shown for messages without a sender (sent by the app itself)
+SYSTEM_SENDER = {
+    "first_name": "system",
+    "avatar": "url for system avatar",
+}
+
+
 class MessageOut(BaseModel):
     """
     Schema for detailed message response with sender information
@@ -69,7 +75,7 @@ class MessageOut(BaseModel):
     journey_id: UUID
     sender_id: UUID | None
     content: str
-    message_type: str
+    message_type: MessageType
     is_read: bool
     sent_at: datetime
     created_at: datetime
@@ -77,25 +83,23 @@ class MessageOut(BaseModel):
     twilio_msg_id: str | None
     sender: Sender
 
-    @field_validator("sender", mode="before")
     @classmethod
-    def validate_sender(cls, value, info: ValidationInfo):
-        sender_id = info.data.get("sender_id")
-        # check because sender_id is nullable
-        if not sender_id:
-            return {
-                "first_name": "system",
-                "avatar": "url for system avatar",
-            }
-
-        with Session() as sess:
-            quest = sess.query(Questionnaire).filter(Questionnaire.user_id == sender_id).first()
-            primary_photo = (
-                sess.query(Photo)
-                .filter(Photo.user_id == sender_id, Photo.is_primary.is_(True))
-                .first()
-            )
-            return {
-                "first_name": quest.first_name if quest else None,
-                "avatar": primary_photo.file_path if primary_photo else None,
-            }
+    def from_message(cls, msg, sender_profile: dict | None):
+        """
+        Create MessageOut from a Message (or a MessageService.get_messages row)
+        and its sender's profile (see MessageService.get_sender_profiles),
+        without validation: every value comes straight from the database
+        """
+        return cls.model_construct(
+            id=msg.id,
+            journey_id=msg.journey_id,
+            sender_id=msg.sender_id,
+            content=msg.content,
+            message_type=msg.message_type,
+            is_read=msg.is_read,
+            sent_at=msg.sent_at,
+            created_at=msg.created_at,
+            updated_at=msg.updated_at,
+            twilio_msg_id=msg.twilio_msg_id,
+            sender=Sender.model_construct(**(sender_profile if msg.sender_id else SYSTEM_SENDER)),
+        )
@@ -1,3 +1,4 @@
+import re
 from datetime import datetime
 from typing import Optional
 from uuid import UUID
@@ -7,25 +8,27 @@ from pydantic import BaseModel, ConfigDict, EmailStr, Field, field_validator
 from app.core.security import utc_now
 from app.models.enums import SubscriptionType
 
+PHONE_REGION_PATTERN = re.compile(r"\+[0-9]{1,3}")
+PHONE_NUMBER_PATTERN = re.compile(r"[0-9]{8,9}")
+
 
 def validate_phone_region(v: str) -> str:
     if not isinstance(v, str):
         return v
 
+    if PHONE_REGION_PATTERN.fullmatch(v):
+        return v
+
     if not v.startswith("+"):
         raise ValueError("Phone region must start with '+'.")
-
-    code = v.removeprefix("+")
-    if not code.isdigit() or not (1 <= len(code) <= 3):
-        raise ValueError("Phone region must be a 1, 2, or 3-digit number.")
-    return v
+    raise ValueError("Phone region must be a 1, 2, or 3-digit number.")
 
 
 def validate_phone_number(v: str) -> str:
     if not isinstance(v, str):
         return v
 
-    if not v.isdigit() or not (8 <= len(v) <= 9):
+    if not PHONE_NUMBER_PATTERN.fullmatch(v):
         raise ValueError("Phone number must be an 8 or 9-digit number.")
     return v
 
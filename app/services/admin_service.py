@@ -5,7 +5,7 @@ from uuid import UUID
 from fastapi import HTTPException
 from fastapi import status as http_status
 from sqlalchemy import func
-from sqlalchemy.orm import Query
+from sqlalchemy.orm import Query, selectinload
 
 from app.core.security import utc_now
 from app.models.enums import JourneyStatus, MatchStatus, MeetingStatus
@@ -104,12 +104,12 @@ class AdminService(BaseService):
         return user
 
     def get_matches(
-        self, status: str = None, min_compatibility_score: float = None
+        self, status: MatchStatus | None = None, min_compatibility_score: float = None
     ) -> Query[Match]:
         """
         Get all matches with optional status filter
         """
-        query = self.session.query(Match)
+        query = self.session.query(Match).options(selectinload(Match.journey))
 
         if status:
             query = query.filter(Match.status == status)
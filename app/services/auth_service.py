@@ -22,6 +22,7 @@ from app.models.token import RefreshToken
 from app.models.user import User
 from app.schemas.auth import CompleteProfileRequest, UpdatePhoneRequest
 from app.services.base_service import BaseService
+from app.services.notification_service import forget_receiver_token
 from app.services.user_service import UserService
 
 
@@ -286,6 +287,7 @@ class AuthService(BaseService):
                 )
             if update_token:
                 user.firebase_token = firebase_token
+                forget_receiver_token(user.id)
             # Update last login timestamp
             user.last_login = utc_now()
 
@@ -377,6 +379,7 @@ class AuthService(BaseService):
             # Update existing user
             if update_token:
                 user.firebase_token = firebase_token
+                forget_receiver_token(user.id)
             user.last_login = utc_now()
             user.is_verified = True
 
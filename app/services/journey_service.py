@@ -1,19 +1,22 @@
-from typing import Optional
+from typing import Iterable, Optional
 from uuid import UUID
 
 from fastapi import HTTPException
 from fastapi import status as http_status
-from sqlalchemy import or_
+from sqlalchemy import Row, or_
 from sqlalchemy.exc import DataError
 from sqlalchemy.orm import Query, Session
 
 from app.core.config import settings
 from app.core.security import utc_now
+from app.core.utils import TTLCache
 from app.models.enums import JourneyStatus, JourneyStep, MeetingStatus
 from app.models.journey import Journey
 from app.models.match import Match
 from app.models.meeting import MeetingFeedback, MeetingRequest
 from app.models.message import Message
+from app.models.photo import Photo
+from app.models.questionnaire import Questionnaire
 from app.models.user import User
 from app.schemas.meeting import MeetingFeedbackCreate, MeetingRequestCreate
 
@@ -21,6 +24,14 @@ from .base_service import BaseService
 from .notification_service import NotificationService
 from .twilio_service import TwilioService
 
+# sender_id -> {"first_name": ..., "avatar": ...} shown next to chat messages
+sender_profile_cache = TTLCache(ttl=300, maxsize=10_000)
+
+
+def forget_sender_profile(user_id: UUID):
+    """drop the cached sender profile of `user_id` (call when its first name or primary photo changes)"""
+    sender_profile_cache.discard(user_id)
+
 
 class JourneyService(BaseService):
     """
@@ -236,15 +247,64 @@ class MessageService(BaseService):
     Service for message-related operations within journeys
     """
 
-    def get_messages(self, journey_id: UUID) -> Query[Message]:
+    # columns needed to render a chat list (no relationships, no moderation columns)
+    MESSAGE_LIST_COLUMNS = (
+        Message.id,
+        Message.journey_id,
+        Message.sender_id,
+        Message.content,
+        Message.message_type,
+        Message.is_read,
+        Message.sent_at,
+        Message.created_at,
+        Message.updated_at,
+        Message.twilio_msg_id,
+    )
+
+    def get_messages(self, journey_id: UUID) -> Query[Row]:
         """
-        Get messages for a journey
+        Get messages for a journey, as plain rows instead of hydrated Message objects
         """
         return (
-            self.session.query(Message)
+            self.session.query(*self.MESSAGE_LIST_COLUMNS)
             .filter(Message.journey_id == journey_id)
-            .order_by(Message.created_at.desc())
+            .order_by(Message.sent_at.desc())
+        )
+
+    def get_sender_profiles(self, sender_ids: Iterable[UUID | None]) -> dict[UUID, dict]:
+        """
+        Get the first name and primary photo of each sender:
+        cached per sender, the missing ones are loaded in 2 queries for the whole page
+        """
+        profiles = {}
+        missing_ids = set()
+        for sender_id in set(sender_ids):
+            if not sender_id:
+                continue
+            profile = sender_profile_cache.get(sender_id)
+            if profile is None:
+                missing_ids.add(sender_id)
+            else:
+                profiles[sender_id] = profile
+
+        if not missing_ids:
+            return profiles
+
+        first_names = dict(
+            self.session.query(Questionnaire.user_id, Questionnaire.first_name)
+            .filter(Questionnaire.user_id.in_(missing_ids))
+            .all()
+        )
+        avatars = dict(
+            self.session.query(Photo.user_id, Photo.file_path)
+            .filter(Photo.user_id.in_(missing_ids), Photo.is_primary.is_(True))
+            .all()
         )
+        for sender_id in missing_ids:
+            profile = {"first_name": first_names.get(sender_id), "avatar": avatars.get(sender_id)}
+            sender_profile_cache.set(sender_id, profile)
+            profiles[sender_id] = profile
+        return profiles
 
     def get_journey_message(self, journey_id: UUID, msg_id: UUID) -> Optional[Message]:
         """
@@ -412,7 +472,11 @@ class MeetingService(BaseService):
             requester = self.session.get(User, requester_id)
 
             if other_user and requester:
-                requester_name = requester.questionnaire.first_name or "Your Match"
+                requester_name = (
+                    self.session.query(Questionnaire.first_name)
+                    .filter(Questionnaire.user_id == requester_id)
+                    .scalar()
+                ) or "Your Match"
                 NotificationService().send_meeting_request_notification(
                     other_user, meeting_request, requester_name
                 )
@@ -4,7 +4,7 @@ from uuid import UUID
 from fastapi import HTTPException
 from fastapi import status as http_status
 from sqlalchemy import and_, or_
-from sqlalchemy.orm import Query
+from sqlalchemy.orm import Query, selectinload
 
 from app.models.match import Match, MatchStatus
 
@@ -44,12 +44,15 @@ class MatchService(BaseService):
         """
         return self.session.query(Match)
 
-    def get_user_matches(self, user_id: UUID, status: str = None) -> Query[Match]:
+    def get_user_matches(self, user_id: UUID, status: MatchStatus | None = None) -> Query[Match]:
         """
         Get all matches for a user
         """
-        query = self.session.query(Match).filter(
-            or_(Match.user1_id == user_id, Match.user2_id == user_id)
+        # MatchOut.from_match reads match.journey: load them in one query per page
+        query = (
+            self.session.query(Match)
+            .options(selectinload(Match.journey))
+            .filter(or_(Match.user1_id == user_id, Match.user2_id == user_id))
         )
 
         if status:
@@ -9,7 +9,7 @@ import logging
 from typing import Optional, Tuple
 from uuid import UUID
 
-from sqlalchemy import and_, or_
+from sqlalchemy import and_, func, or_
 from sqlalchemy.orm import Session
 
 from app.core.security import utc_now
@@ -147,8 +147,9 @@ class MatchingCronService:
         # 4. Don't have too many existing matches
         # 5. Haven't been processed recently (optional optimization)
 
-        # unused variable
-        subquery_match_count = (  # noqa: F841
+        # count every user's non-declined matches in one grouped query,
+        # instead of one count query per candidate user
+        match_user_ids = (
             self.session.query(Match.user1_id.label("user_id"))
             .filter(Match.status != MatchStatus.DECLINED)
             .union_all(
@@ -158,10 +159,16 @@ class MatchingCronService:
             )
             .subquery()
         )
+        match_counts = (
+            self.session.query(match_user_ids.c.user_id, func.count().label("match_count"))
+            .group_by(match_user_ids.c.user_id)
+            .subquery()
+        )
 
-        users = (
+        return (
             self.session.query(User)
             .join(Questionnaire, User.id == Questionnaire.user_id)
+            .outerjoin(match_counts, match_counts.c.user_id == User.id)
             .filter(
                 User.is_active.is_(True),
                 User.is_deleted.is_(False),
@@ -170,19 +177,11 @@ class MatchingCronService:
                 User.has_completed_questionnaire.is_(True),
                 Questionnaire.gender.isnot(None),
                 Questionnaire.gender.in_([Gender.HOMME, Gender.FEMME]),
+                func.coalesce(match_counts.c.match_count, 0) < self.max_matches_per_user,
             )
             .all()
         )
 
-        # Filter users who don't have too many matches
-        eligible_users = []
-        for user in users:
-            match_count = self._get_user_match_count(user.id)
-            if match_count < self.max_matches_per_user:
-                eligible_users.append(user)
-
-        return eligible_users
-
     def _is_user_eligible_for_matching(self, user: User) -> bool:
         """
         Check if a user is eligible for matching
@@ -204,7 +203,10 @@ class MatchingCronService:
 
         # Check if user has questionnaire with gender
         questionnaire = (
-            self.session.query(Questionnaire).filter(Questionnaire.user_id == user.id).first()
+            self.session.query(Questionnaire)
+            .options(Questionnaire.load_only_for("gender"))
+            .filter(Questionnaire.user_id == user.id)
+            .first()
         )
 
         if not questionnaire or not questionnaire.gender:
@@ -1,12 +1,14 @@
+import logging
 from typing import Any, Dict
 from uuid import UUID
 
 from fastapi import HTTPException
 from fastapi import status as http_status
 from firebase_admin.exceptions import InvalidArgumentError
-from sqlalchemy.orm import Query
+from sqlalchemy.orm import Query, Session, raiseload, selectinload
 
 from app.core.database import SessionLocal
+from app.core.utils import TTLCache
 from app.models.journey import Journey
 from app.models.match import Match
 from app.models.meeting import MeetingRequest
@@ -17,6 +19,11 @@ from app.schemas.notifications import NotificationUpdate
 
 from .base_service import BaseService
 
+logger = logging.getLogger(__name__)
+
+# (journey_id, sender_id) -> (receiver_id, receiver's firebase token or None if not notifiable)
+receiver_token_cache = TTLCache(ttl=60, maxsize=10_000)
+
 
 class NotificationService(BaseService):
     """
@@ -86,19 +93,22 @@ class NotificationService(BaseService):
         """
         Send notification about a new potential match for both users
         """
-        notif = self.create_notification(
-            user_id=match.user1_id,
-            title="New Match",
-            body=f"'{match.user2.name}' might be compatible with you!",
-        )
-        notif.send_to_user(data={"match_id": str(match.id), "type": "new_match"})
+        # read everything needed before the commit (which expires the match and its users)
+        user1, user2 = match.user1, match.user2
+        data = {"match_id": str(match.id), "type": "new_match"}
+        notifs = [
+            Notification(
+                user=user1, title="New Match", body=f"'{user2.name}' might be compatible with you!"
+            ),
+            Notification(
+                user=user2, title="New Match", body=f"'{user1.name}' might be compatible with you!"
+            ),
+        ]
+        self.session.add_all(notifs)
+        self.session.commit()
 
-        notif = self.create_notification(
-            user_id=match.user2_id,
-            title="New Match",
-            body=f"'{match.user1.name}' might be compatible with you!",
-        )
-        notif.send_to_user(data={"match_id": str(match.id), "type": "new_match"})
+        for notif in notifs:
+            notif.send_to_user(data=data)
 
     def send_match_confirmed_notification(self, user: User, match: Match) -> bool:
         """
@@ -219,8 +229,51 @@ class NotificationService(BaseService):
 
 def new_match_notif_task(match_id: UUID):
     with SessionLocal() as session:
-        match = session.get(Match, match_id)
+        match = session.get(
+            Match, match_id, options=[selectinload(Match.user1), selectinload(Match.user2)]
+        )
         try:
             NotificationService(session).send_new_match_notification(match)
         except InvalidArgumentError as e:
-            print(f"error sending new match notif: {e}")
+            logger.error(f"error sending new match notif: {e}")
+
+
+def forget_receiver_token(user_id: UUID):
+    """drop the cached tokens of `user_id` (call when its firebase token changes)"""
+    receiver_token_cache.discard_where(lambda value: value[0] == user_id)
+
+
+def get_receiver_token(session: Session, message: Message) -> str | None:
+    """firebase token of the message's receiver, cached per (journey, sender)"""
+    key = (message.journey_id, message.sender_id)
+    cached = receiver_token_cache.get(key)
+    if cached is None:
+        # load journey -> match -> both users at once,
+        # any other relationship access raises instead of silently lazy loading
+        journey = (
+            session.query(Journey)
+            .options(
+                selectinload(Journey.match).options(
+                    selectinload(Match.user1).raiseload("*"),
+                    selectinload(Match.user2).raiseload("*"),
+                ),
+                raiseload("*"),
+            )
+            .filter(Journey.id == message.journey_id)
+            .one()
+        )
+        receiver = journey.match.get_other_user(message.sender_id)
+        notifiable = receiver.is_active and not receiver.is_deleted
+        cached = (receiver.id, receiver.firebase_token if notifiable else None)
+        receiver_token_cache.set(key, cached)
+    return cached[1]
+
+
+def new_msg_notif_task(message_id: UUID, title: str):
+    with SessionLocal() as session:
+        message = session.get(Message, message_id)
+        try:
+            receiver_token = get_receiver_token(session, message)
+            message.send_notif_to_receiver(title=title, receiver_token=receiver_token)
+        except Exception as e:
+            logger.error(f"error sending new msg notif: {type(e).__name__}: {e}")
@@ -12,6 +12,7 @@ from app.core.config import settings
 from app.models import Photo
 
 from .base_service import BaseService
+from .journey_service import forget_sender_profile
 
 
 class PhotoService(BaseService):
@@ -92,6 +93,8 @@ class PhotoService(BaseService):
         self.session.add(photo)
         self.session.commit()
         self.session.refresh(photo)
+        if photo.is_primary:
+            forget_sender_profile(user_id)
 
         return photo
 
@@ -128,6 +131,7 @@ class PhotoService(BaseService):
             if next_photo:
                 next_photo.is_primary = True
                 self.session.commit()
+            forget_sender_profile(user_id)
 
     def set_primary_photo(self, user_id: UUID, photo_id: UUID) -> Photo:
         """
@@ -152,5 +156,6 @@ class PhotoService(BaseService):
         photo.is_primary = True
         self.session.commit()
         self.session.refresh(photo)
+        forget_sender_profile(user_id)
 
         return photo
@@ -5,15 +5,22 @@ from sqlalchemy import select
 from sqlalchemy.orm import Session, selectinload
 
 from app.core.security import utc_now
+from app.core.utils import TTLCache
 from app.models import (
     Questionnaire,
     QuestionnaireCategory,
     QuestionnaireField,
     QuestionnaireSubCategory,
 )
-from app.schemas.questionnaire import QuestionnaireCreate, QuestionnaireUpdate
+from app.schemas.questionnaire import CategoryOut, QuestionnaireCreate, QuestionnaireUpdate
 
 from .base_service import BaseService
+from .journey_service import forget_sender_profile
+
+# the questionnaire structure is read on every form render and written only by insert_fields.py
+# (another process), so entries just expire
+CATEGORIES_CACHE_KEY = "all"
+categories_cache = TTLCache(ttl=600, maxsize=1)
 
 
 class QuestionnaireService(BaseService):
@@ -40,6 +47,7 @@ class QuestionnaireService(BaseService):
         self.session.add(questionnaire)
         self.session.commit()
         self.session.refresh(questionnaire)
+        forget_sender_profile(user_id)
         return questionnaire
 
     def get_or_create_questionnaire(self, user_id: UUID) -> Questionnaire:
@@ -67,6 +75,8 @@ class QuestionnaireService(BaseService):
 
         self.session.commit()
         self.session.refresh(quest)
+        if "first_name" in update_data:
+            forget_sender_profile(quest.user_id)
         return quest
 
     def complete_questionnaire(self, quest: Questionnaire) -> Optional[Questionnaire]:
@@ -86,27 +96,41 @@ class QuestionnaireService(BaseService):
         self.session.refresh(quest)
         return quest
 
-    def get_all_categories(self) -> list[QuestionnaireCategory]:
-        stmt = select(QuestionnaireCategory).options(
-            selectinload(QuestionnaireCategory.sub_categories).options(
-                selectinload(QuestionnaireSubCategory.fields).options(
-                    selectinload(QuestionnaireField.children)
+    def get_all_categories(self) -> list[dict]:
+        """
+        Questionnaire structure (categories > sub categories > fields) as CategoryOut dicts,
+        cached for a few minutes: it only changes when the fields are re-seeded.
+        The cached list itself is returned: callers must build new lists / dicts
+        instead of mutating it
+        """
+        categories = categories_cache.get(CATEGORIES_CACHE_KEY)
+        if categories is None:
+            # one SELECT ... IN per level (no joinedload row explosion);
+            # recursion_depth also loads the children's own (empty) children lists,
+            # which FieldOut.children would otherwise lazy load one by one
+            stmt = select(QuestionnaireCategory).options(
+                selectinload(QuestionnaireCategory.sub_categories).options(
+                    selectinload(QuestionnaireSubCategory.fields).options(
+                        selectinload(QuestionnaireField.children, recursion_depth=1)
+                    )
                 )
             )
-        )
+            categories = [
+                CategoryOut.model_validate(category).model_dump()
+                for category in self.session.scalars(stmt)
+            ]
+            categories_cache.set(CATEGORIES_CACHE_KEY, categories)
 
-        return self.session.execute(stmt).scalars().all()
+        return categories
 
-    def get_required_fields(self) -> list[QuestionnaireField]:
-        return (
-            self.session.query(QuestionnaireField)
-            .filter(QuestionnaireField.required.is_(True))
-            .all()
-        )
+    def get_required_field_names(self) -> tuple[str, ...]:
+        """names of the required fields (selected directly, no QuestionnaireField hydration)"""
+        stmt = select(QuestionnaireField.name).where(QuestionnaireField.required.is_(True))
+        return tuple(self.session.scalars(stmt))
 
-    def get_missing_required_fields(self, quest: Questionnaire):
+    def get_missing_required_fields(self, quest: Questionnaire) -> list[str]:
         return [
-            field.name
-            for field in self.get_required_fields()
-            if getattr(quest, field.name, None) in (None, "", [])
+            name
+            for name in self.get_required_field_names()
+            if getattr(quest, name, None) in (None, "", [])
         ]
@@ -86,5 +86,6 @@ def init_firebase():
     os.environ.setdefault("GOOGLE_CLOUD_PROJECT", project_id)
 
     # Provide projectId explicitly to avoid auth service errors when project ID isn't inferred
-    options = {"projectId": project_id} if project_id else None
-    return firebase_admin.initialize_app(cred, options or {})
+    # httpTimeout bounds each FCM/auth HTTP call (seconds) so a slow send can't hang a worker
+    options = {"projectId": project_id, "httpTimeout": 10}
+    return firebase_admin.initialize_app(cred, options)
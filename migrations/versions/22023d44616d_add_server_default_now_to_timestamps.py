@@ -0,0 +1,61 @@
+"""add server default now() to created_at / updated_at
+
+Revision ID: 22023d44616d
+Revises: 6b27c4bb176a
+Create Date: 2026-10-17 13:05:12.384519
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "22023d44616d"
+down_revision: Union[str, None] = "6b27c4bb176a"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLES = [
+    "apscheduler_jobs",
+    "journey",
+    "match",
+    "meeting_feedback",
+    "meeting_request",
+    "message",
+    "notification",
+    "photo",
+    "questionnaire",
+    "questionnaire_category",
+    "questionnaire_field",
+    "questionnaire_subcategory",
+    "refresh_token",
+    "user",
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table in TABLES:
+        for column in ("created_at", "updated_at"):
+            op.alter_column(
+                table,
+                column,
+                existing_type=sa.DateTime(timezone=True),
+                server_default=sa.text("now()"),
+                existing_nullable=False,
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in reversed(TABLES):
+        for column in ("updated_at", "created_at"):
+            op.alter_column(
+                table,
+                column,
+                existing_type=sa.DateTime(timezone=True),
+                server_default=None,
+                existing_nullable=False,
+            )
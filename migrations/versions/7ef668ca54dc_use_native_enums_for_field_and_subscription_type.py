@@ -0,0 +1,70 @@
+"""use native postgres enums for questionnaire_field.field_type and user.subscription_type
+
+Revision ID: 7ef668ca54dc
+Revises: f1bb845d2436
+Create Date: 2026-10-17 14:07:33.620417
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "7ef668ca54dc"
+down_revision: Union[str, None] = "f1bb845d2436"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, column, enum type name, values)
+ENUM_COLUMNS = [
+    (
+        "questionnaire_field",
+        "field_type",
+        "field_type",
+        (
+            "text",
+            "text_area",
+            "integer",
+            "range",
+            "select",
+            "fields_group",
+            "boolean",
+            "multiple_select",
+            "array",
+        ),
+    ),
+    ("user", "subscription_type", "subscription_type", ("gratuit", "premium")),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table, column, type_name, values in ENUM_COLUMNS:
+        enum_type = postgresql.ENUM(*values, name=type_name)
+        enum_type.create(op.get_bind(), checkfirst=True)
+        op.alter_column(
+            table,
+            column,
+            existing_type=sa.String(),
+            type_=enum_type,
+            existing_nullable=False,
+            postgresql_using=f"{column}::{type_name}",
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table, column, type_name, values in reversed(ENUM_COLUMNS):
+        enum_type = postgresql.ENUM(*values, name=type_name)
+        op.alter_column(
+            table,
+            column,
+            existing_type=enum_type,
+            type_=sa.String(),
+            existing_nullable=False,
+            postgresql_using=f"{column}::text",
+        )
+        enum_type.drop(op.get_bind(), checkfirst=True)
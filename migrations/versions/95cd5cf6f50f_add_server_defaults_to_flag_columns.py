@@ -0,0 +1,52 @@
+"""add server defaults to journey, message and match flag columns
+
+Revision ID: 95cd5cf6f50f
+Revises: 91cb75d7f6bd
+Create Date: 2026-10-17 12:26:03.561870
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "95cd5cf6f50f"
+down_revision: Union[str, None] = "91cb75d7f6bd"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, column, existing type, server default)
+SERVER_DEFAULTS = [
+    ("journey", "current_step", sa.Integer(), "1"),
+    ("journey", "is_completed", sa.Boolean(), "false"),
+    ("message", "is_read", sa.Boolean(), "false"),
+    ("match", "status", sa.Enum(name="match_status"), "'pending'"),
+    ("match", "user1_accepted", sa.Boolean(), "false"),
+    ("match", "user2_accepted", sa.Boolean(), "false"),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table, column, existing_type, default in SERVER_DEFAULTS:
+        op.alter_column(
+            table,
+            column,
+            existing_type=existing_type,
+            server_default=sa.text(default),
+            existing_nullable=False,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table, column, existing_type, _ in reversed(SERVER_DEFAULTS):
+        op.alter_column(
+            table,
+            column,
+            existing_type=existing_type,
+            server_default=None,
+            existing_nullable=False,
+        )
@@ -0,0 +1,47 @@
+"""use a native postgres enum for user.social_provider
+
+Revision ID: cffa5c65cc26
+Revises: 7ef668ca54dc
+Create Date: 2026-10-17 14:18:51.072944
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "cffa5c65cc26"
+down_revision: Union[str, None] = "7ef668ca54dc"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+social_provider = postgresql.ENUM("google", "apple", name="social_provider")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    social_provider.create(op.get_bind(), checkfirst=True)
+    op.alter_column(
+        "user",
+        "social_provider",
+        existing_type=sa.String(),
+        type_=social_provider,
+        existing_nullable=True,
+        postgresql_using="social_provider::social_provider",
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.alter_column(
+        "user",
+        "social_provider",
+        existing_type=social_provider,
+        type_=sa.String(),
+        existing_nullable=True,
+        postgresql_using="social_provider::text",
+    )
+    social_provider.drop(op.get_bind(), checkfirst=True)
@@ -0,0 +1,38 @@
+"""add message flagged partial index
+
+Revision ID: e40ba0352142
+Revises: 22023d44616d
+Create Date: 2026-10-17 13:21:47.905362
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e40ba0352142"
+down_revision: Union[str, None] = "22023d44616d"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CONCURRENTLY can't run inside the migration transaction
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_message_flagged",
+            "message",
+            [sa.text("created_at DESC")],
+            unique=False,
+            postgresql_where=sa.text("is_flagged IS true"),
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index("ix_message_flagged", table_name="message", postgresql_concurrently=True)
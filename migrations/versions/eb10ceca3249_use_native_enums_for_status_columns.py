@@ -0,0 +1,66 @@
+"""use native postgres enums for match/meeting status and message type
+
+Revision ID: eb10ceca3249
+Revises: 8bf62b9b99a8
+Create Date: 2026-10-17 11:02:54.118907
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "eb10ceca3249"
+down_revision: Union[str, None] = "8bf62b9b99a8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, column, enum type name, values)
+ENUM_COLUMNS = [
+    ("match", "status", "match_status", ("pending", "active", "declined", "paused", "ended")),
+    (
+        "meeting_request",
+        "status",
+        "meeting_status",
+        ("proposee", "acceptee", "refusee", "terminee", "annulee"),
+    ),
+    (
+        "message",
+        "message_type",
+        "message_type",
+        ("texte", "demande_appel_vocal", "demande_appel_video"),
+    ),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table, column, type_name, values in ENUM_COLUMNS:
+        enum_type = postgresql.ENUM(*values, name=type_name)
+        enum_type.create(op.get_bind(), checkfirst=True)
+        op.alter_column(
+            table,
+            column,
+            existing_type=sa.String(),
+            type_=enum_type,
+            existing_nullable=False,
+            postgresql_using=f"{column}::{type_name}",
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table, column, type_name, values in reversed(ENUM_COLUMNS):
+        enum_type = postgresql.ENUM(*values, name=type_name)
+        op.alter_column(
+            table,
+            column,
+            existing_type=enum_type,
+            type_=sa.String(),
+            existing_nullable=False,
+            postgresql_using=f"{column}::text",
+        )
+        enum_type.drop(op.get_bind(), checkfirst=True)
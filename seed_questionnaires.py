@@ -326,14 +326,13 @@ def create_questionnaire_for_user(session: Session, user_id: int, gender: str, u
         completed_at=utc_now(),
     )
 
+    # committed by the caller, once for all users: the inserts go out as multi-row batches
     session.add(questionnaire)
-    session.commit()
 
     # Update user completion status
     user = session.query(User).filter(User.id == user_id).first()
     if user:
         user.has_completed_questionnaire = True
-        session.commit()
 
     print(f"  ✅ Created questionnaire for {user_name}")
     print(f"     Age: {data['age']}, Goal: {data['relationship_goal']}")
@@ -372,6 +371,7 @@ def seed_questionnaires_from_file(session: Session):
         if questionnaire:
             created_count += 1
 
+    session.commit()
     print(f"\n🎉 Successfully created {created_count} questionnaires!")
     return True
 
@@ -403,6 +403,7 @@ def seed_questionnaires_from_db(session: Session):
             if questionnaire:
                 created_count += 1
 
+        session.commit()
         print(f"\n🎉 Successfully created {created_count} questionnaires!")
         return True
 